@@ -4,82 +4,134 @@
 Build script for creating the standalone executable using PyInstaller
 """
 
+import os
 import sys
+import time
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-import PyInstaller.__main__
+from typing import Optional
+
+# Build layout (the icon path lives in resolve_ai_helper.spec)
+BUILD = Path("build")
+DIST = Path("dist")
+ONEDIR_SRC = DIST / "resolve_ai_helper"
+ONEFILE_EXE = DIST / "resolve_ai_helper.exe"
+COMP_READY = DIST / "ResolveAIHelper"
+# Packaging moves the onedir build here (see create_distribution_package)
+PACKAGED_ONEDIR = COMP_READY / "resolve_ai_helper"
+LAUNCHER_SRC = Path("resolve_scripts/launch_transcribe_ui.py")
+
+
+def _fast_copytree(src: Path, dst: Path):
+    """Copy a directory tree, using multithreaded robocopy on Windows."""
+    if sys.platform == "win32":
+        import subprocess
+        result = subprocess.run(
+            ["robocopy", str(src), str(dst), "/E", "/MT:32",
+             "/NFL", "/NDL", "/NP", "/NJH", "/NJS"],
+            check=False
+        )
+        # robocopy exit codes 0-7 mean success, 8+ mean failure
+        if result.returncode > 7:
+            raise OSError(f"robocopy failed with exit code {result.returncode}")
+    else:
+        # Skip the per-file copystat that copy2 would do
+        shutil.copytree(src, dst, copy_function=shutil.copy)
+
+
+def _fast_rmtree(path: Path):
+    """Delete a directory tree with the OS-native recursive delete."""
+    import subprocess
+    if sys.platform == "win32":
+        cmd = ["cmd", "/c", "rmdir", "/S", "/Q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+    try:
+        subprocess.run(cmd, check=False)
+    except FileNotFoundError:
+        pass
+    if path.exists():
+        shutil.rmtree(path)
 
 
 def clean_build_dirs():
     """Clean up build and dist directories."""
     print("Cleaning build directories...")
     
-    build_dir = Path("build")
-    dist_dir = Path("dist")
-    
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-        print(f"  [OK] Removed {build_dir}")
-    
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-        print(f"  [OK] Removed {dist_dir}")
+    for path in (BUILD, DIST):
+        # One scandir both checks existence and spots an already-empty dir
+        try:
+            with os.scandir(path) as it:
+                empty = next(it, None) is None
+        except FileNotFoundError:
+            continue
+        if empty:
+            os.rmdir(path)
+        else:
+            _fast_rmtree(path)
+        print(f"  [OK] Removed {path}")
     
     print()
 
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def _use_fast_archive_compression():
+    """
+    Switch PyInstaller's PYZ/PKG archives to the fastest zlib level.
+
+    In the --noarchive variant the PYZ holds almost nothing, so this then
+    mainly affects the small PKG archive embedded in the exe.
+    """
+    # The bootloader only inflates zlib, so keep the format and lower the level
+    from PyInstaller.archive import writers
+    for writer in (writers.ZlibArchiveWriter, writers.CArchiveWriter):
+        if hasattr(writer, "_COMPRESSION_LEVEL"):
+            writer._COMPRESSION_LEVEL = 1
+        else:
+            # Private attribute; PyInstaller may rename it between releases
+            print(f"[WARN] {writer.__name__}._COMPRESSION_LEVEL not found; "
+                  "archive compression level left at PyInstaller's default")
+
+
+def build_executable(clean_future: Optional[Future] = None, noarchive: bool = False):
+    """
+    Build the executable using PyInstaller.
+
+    Args:
+        clean_future: Pending clean_build_dirs() job; waited on right before
+            PyInstaller starts writing to build/ and dist/
+        noarchive: Build the variant with loose .pyc files instead of a PYZ
+            (read by resolve_ai_helper.spec)
+    """
+    import PyInstaller.__main__ as pyi
+
     print("Building executable with PyInstaller...")
     print("-" * 60)
     
-    # PyInstaller arguments (stable, minimal and fast)
+    # Hidden imports, excludes and bundle layout live in the spec file
     args = [
-        'core/cli.py',                     # Entry point
-        '--name=resolve_ai_helper',        # Output name
-        '--onedir',                        # Directory with fast-start exe
-        '--console',                       # Show console window (needed for CLI)
-        '--clean',                         # Clean cache before building
-
-        # Ensure Qt core modules are included (no web/qml)
-        '--hidden-import=PySide6.QtCore',
-        '--hidden-import=PySide6.QtWidgets',
-        '--hidden-import=PySide6.QtGui',
-
-        # Faster-whisper runtime (no models bundled)
-        '--hidden-import=faster_whisper',
-        '--hidden-import=tqdm',
-        '--collect-all=faster_whisper',
-
-        # Exclude known heavy/unused packages
-        '--exclude-module=matplotlib',
-        '--exclude-module=scipy',
-        '--exclude-module=pandas',
-        '--exclude-module=notebook',
-        '--exclude-module=IPython',
-        '--exclude-module=PIL',
-        '--exclude-module=torch',
-        '--exclude-module=PySide6.QtWebEngineCore',
-        '--exclude-module=PySide6.QtWebEngineWidgets',
-        '--exclude-module=PySide6.QtWebEngineQuick',
-
-        # Don't confirm overwrite
-        '--noconfirm',
-
-        # Mild bytecode optimize only (no strip on Windows)
-        '--optimize=2',
+        'resolve_ai_helper.spec',
+        '--workpath=build/pyi-cache',      # Persistent analysis cache (wiped by --clean)
+        '--distpath=dist',
+        '--noconfirm',                     # Don't confirm overwrite
     ]
     
-    # Add icon if it exists
-    icon_path = Path("resources/icon.ico")
-    if icon_path.exists():
-        args.extend(['--icon', str(icon_path)])
+    upx_path = shutil.which("upx")
+    if upx_path:
+        args.extend(['--upx-dir', os.path.dirname(upx_path)])
+    
+    os.environ['RESOLVE_AI_HELPER_NOARCHIVE'] = '1' if noarchive else '0'
     
     print(f"Running: pyinstaller {' '.join(args)}")
+    if noarchive:
+        print("  (noarchive variant: loose .pyc files, no PYZ)")
     print()
     
     try:
-        PyInstaller.__main__.run(args)
+        if clean_future is not None:
+            clean_future.result()
+        _use_fast_archive_compression()
+        pyi.run(args)
         print()
         print("-" * 60)
         print("[OK] Build complete!")
@@ -94,24 +146,38 @@ def build_executable():
         return False
 
 
+def iter_tree_sizes(path):
+    """Yield (path, size) for every file under path using scandir's cached stat."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_tree_sizes(entry.path)
+            else:
+                yield entry.path, entry.stat(follow_symlinks=False).st_size
+
+
 def get_file_size(file_path: Path) -> str:
     """Get human-readable file size."""
     if not file_path.exists():
         return "N/A"
     
-    size = file_path.stat().st_size
-    
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
+    return format_size(file_path.stat().st_size)
+
+
+def format_size(size: int) -> str:
+    """Format a byte count as a human-readable size."""
+    if size == 0:
+        return "0.0 B"
     
-    return f"{size:.1f} TB"
+    # bit_length gives log2 directly: every 10 bits is one 1024x unit
+    units = ('B', 'KB', 'MB', 'GB', 'TB')
+    i = min((size.bit_length() - 1) // 10, len(units) - 1)
+    return f"{size / (1 << (10 * i)):.1f} {units[i]}"
 
 
 def test_executable():
     """Test the built executable."""
-    exe_path = Path("dist/resolve_ai_helper.exe")
+    exe_path = ONEFILE_EXE
     
     if not exe_path.exists():
         print("[ERR] Executable not found, cannot test")
@@ -123,35 +189,62 @@ def test_executable():
     
     import subprocess
     
-    try:
-        # Test version command
-        result = subprocess.run(
-            [str(exe_path), "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode == 0:
-            print(f"[OK] Version check passed: {result.stdout.strip()}")
-        else:
-            print(f"[ERR] Version check failed: {result.stderr}")
-            return False
-        
-        # Test system check
-        result = subprocess.run(
-            [str(exe_path), "check-system", "--json"],
-            capture_output=True,
+    # Skip the per-child console host allocation on Windows
+    popen_kwargs = {}
+    if sys.platform == "win32":
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = 0
+        popen_kwargs = {
+            "creationflags": subprocess.CREATE_NO_WINDOW,
+            "startupinfo": si,
+        }
+    
+    def run_probe(*probe_args):
+        proc = subprocess.Popen(
+            [str(exe_path), *probe_args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=10
+            **popen_kwargs
         )
-        
-        if result.returncode == 0:
-            print(f"[OK] System check passed")
-            print(f"  Output: {result.stdout[:100]}...")
-        else:
-            print(f"[ERR] System check failed: {result.stderr}")
-            return False
+        deadline = time.monotonic() + 10
+        # Short poll slices keep the pipes drained and the thread responsive
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.01)
+                break
+            except subprocess.TimeoutExpired:
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+    
+    try:
+        # The probes are independent, so launch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            version_future = executor.submit(run_probe, "--version")
+            system_future = executor.submit(run_probe, "check-system", "--json")
+            
+            # Test version command
+            result = version_future.result()
+            
+            if result.returncode == 0:
+                print(f"[OK] Version check passed: {result.stdout.strip()}")
+            else:
+                print(f"[ERR] Version check failed: {result.stderr}")
+                return False
+            
+            # Test system check
+            result = system_future.result()
+            
+            if result.returncode == 0:
+                print(f"[OK] System check passed")
+                print(f"  Output: {result.stdout[:100]}...")
+            else:
+                print(f"[ERR] System check failed: {result.stderr}")
+                return False
         
         print()
         print("[OK] All tests passed!")
@@ -165,25 +258,43 @@ def test_executable():
         return False
 
 
-def create_distribution_package():
-    """Create a single folder ready to copy into Resolve's Comp directory."""
+def create_distribution_package(verbose: bool = False):
+    """
+    Create a single folder ready to copy into Resolve's Comp directory.
+
+    Args:
+        verbose: Also walk the folder to report its file count and size
+    """
     print()
     print("Creating Comp-ready folder...")
     print("-" * 60)
     
     # One folder to copy into Comp: dist/ResolveAIHelper/
-    comp_ready_dir = Path("dist/ResolveAIHelper")
-    if comp_ready_dir.exists():
-        shutil.rmtree(comp_ready_dir)
-    comp_ready_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Copy onedir runtime
-    onedir_src = Path("dist/resolve_ai_helper")
-    exe_onefile = Path("dist/resolve_ai_helper.exe")
+    comp_ready_dir = COMP_READY
+    onedir_src = ONEDIR_SRC
+    onedir_dst = PACKAGED_ONEDIR
+    exe_onefile = ONEFILE_EXE
+    
     if onedir_src.exists():
-        shutil.copytree(onedir_src, comp_ready_dir / "resolve_ai_helper")
-        print("  [OK] Added resolve_ai_helper/ (onedir exe)")
+        # A fresh build replaces whatever was packaged before
+        if comp_ready_dir.exists():
+            _fast_rmtree(comp_ready_dir)
+        comp_ready_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            # Same volume: metadata-only rename instead of a per-file copy
+            os.replace(onedir_src, onedir_dst)
+            print("  [OK] Added resolve_ai_helper/ (onedir exe)")
+        except OSError:
+            # Cross-volume: fall back to a bulk copy
+            _fast_copytree(onedir_src, onedir_dst)
+            print("  [OK] Added resolve_ai_helper/ (onedir exe)")
+    elif onedir_dst.exists():
+        # Moved here by an earlier run; it is now the only copy, so keep it
+        print("  [OK] Reusing resolve_ai_helper/ (packaged earlier)")
     elif exe_onefile.exists():
+        if comp_ready_dir.exists():
+            _fast_rmtree(comp_ready_dir)
+        comp_ready_dir.mkdir(parents=True, exist_ok=True)
         shutil.copy(exe_onefile, comp_ready_dir / "resolve_ai_helper.exe")
         print("  [OK] Added resolve_ai_helper.exe (onefile)")
     else:
@@ -191,9 +302,13 @@ def create_distribution_package():
         return False
     
     # Copy the single launcher script only
-    launcher_src = Path("resolve_scripts/launch_transcribe_ui.py")
+    launcher_src = LAUNCHER_SRC
     if launcher_src.exists():
-        shutil.copy(launcher_src, comp_ready_dir / "launch_transcribe_ui.py")
+        # copyfile takes the zero-copy path; carry over mtime only (no chmod)
+        launcher_dst = comp_ready_dir / "launch_transcribe_ui.py"
+        shutil.copyfile(launcher_src, launcher_dst)
+        st = launcher_src.stat()
+        os.utime(launcher_dst, ns=(st.st_atime_ns, st.st_mtime_ns))
         print("  [OK] Added launch_transcribe_ui.py")
     else:
         print("  [ERR] Launcher script not found.")
@@ -201,6 +316,14 @@ def create_distribution_package():
     
     print()
     print(f"[OK] Comp-ready folder created: {comp_ready_dir}")
+    if verbose:
+        # Walks the whole tree, so only on request
+        file_count = 0
+        total_size = 0
+        for _, size in iter_tree_sizes(comp_ready_dir):
+            file_count += 1
+            total_size += size
+        print(f"  {file_count} files, {format_size(total_size)}")
     print("  Copy this entire folder into:")
     print("    C\\ProgramData\\Blackmagic Design\\DaVinci Resolve\\Fusion\\Scripts\\Comp")
     print("  In Resolve: Workspace -> Scripts -> Comp -> ResolveAIHelper -> launch_transcribe_ui")
@@ -215,12 +338,20 @@ def main():
     print("=" * 60)
     print()
     
-    # Step 1: Clean
+    # Step 1: Clean (overlapped with build preparation)
+    executor = None
+    clean_future = None
     if "--clean" in sys.argv or "--full" in sys.argv:
-        clean_build_dirs()
+        executor = ThreadPoolExecutor(max_workers=1)
+        clean_future = executor.submit(clean_build_dirs)
     
     # Step 2: Build
-    if not build_executable():
+    try:
+        built = build_executable(clean_future, noarchive="--noarchive" in sys.argv)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    if not built:
         print("\n[ERR] Build process failed")
         sys.exit(1)
     
@@ -231,16 +362,20 @@ def main():
     
     # Step 4: Package
     if "--package" in sys.argv or "--full" in sys.argv:
-        create_distribution_package()
+        create_distribution_package(verbose="--verbose" in sys.argv)
     
     print()
     print("=" * 60)
     print(" Build Complete!")
     print("=" * 60)
     print()
+    # Packaging moves the onedir build, so point at wherever it ended up
+    exe_path = ONEDIR_SRC / "resolve_ai_helper.exe"
+    if not ONEDIR_SRC.exists() and PACKAGED_ONEDIR.exists():
+        exe_path = PACKAGED_ONEDIR / "resolve_ai_helper.exe"
     print("Next steps:")
-    print("  1. Test the executable: dist/resolve_ai_helper.exe --version")
-    print("  2. Test transcription: dist/resolve_ai_helper.exe check-system")
+    print(f"  1. Test the executable: {exe_path.as_posix()} --version")
+    print(f"  2. Test transcription: {exe_path.as_posix()} check-system")
     print("  3. Copy to Resolve scripts location")
     print()
 
@@ -7,8 +7,15 @@ Provides AI-powered transcription capabilities for DaVinci Resolve free version.
 __version__ = "0.1.0"
 __author__ = "Resolve AI Helper Contributors"
 
-from .transcribe import transcribe_video
-from .model_manager import ModelManager
-
 __all__ = ["transcribe_video", "ModelManager", "__version__"]
 
+
+def __getattr__(name):
+    # Lazy exports (PEP 562): keep faster-whisper out of `import core`
+    if name == "transcribe_video":
+        from .transcribe import transcribe_video
+        return transcribe_video
+    if name == "ModelManager":
+        from .model_manager import ModelManager
+        return ModelManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
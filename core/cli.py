@@ -6,6 +6,8 @@ Command-line interface for Resolve AI Helper
 
 import sys
 import argparse
+import functools
+import importlib
 import json
 from pathlib import Path
 from typing import Optional
@@ -14,12 +16,6 @@ from typing import Optional
 if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from PySide6.QtWidgets import QApplication
-from threading import Thread
-import sys as _sys
-import json as _json
-import queue as _queue
-
 # Handle both direct execution and module import
 try:
     from . import __version__
@@ -32,6 +28,63 @@ except ImportError:
     from core import __version__
     from core.utils import json_response
 
+_PKG = __package__ or "core"
+
+# Payload for generate-test-srt, encoded once at import
+_TEST_SRT_BYTES = (
+    "1\n"
+    "00:00:00,000 --> 00:00:02,500\n"
+    "Hello from resolve_ai_helper.exe!\n\n"
+    "2\n"
+    "00:00:02,700 --> 00:00:05,000\n"
+    "This verifies the exe → Resolve roundtrip.\n\n"
+).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy(module: str, *names: str) -> tuple:
+    """Import names from a core submodule on first use; cached afterwards."""
+    mod = importlib.import_module(f"{_PKG}.{module}")
+    return tuple(getattr(mod, name) for name in names)
+
+
+# Fixed IPC envelopes, serialized once
+_CANCEL_JSON = json_response(False, error="cancel")
+
+_APP = None
+
+
+def _launcher_timeline_info(timeline_name: Optional[str]) -> dict:
+    """
+    Read the timeline info the Resolve launcher leaves in the temp folder.
+    
+    Returns:
+        The launcher's dict (name, duration, fps) if it is for timeline_name,
+        otherwise an empty dict
+    """
+    get_temp_dir, = _lazy('utils', 'get_temp_dir')
+    try:
+        info = json.loads((get_temp_dir() / "resolve_timeline_info.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(info, dict) or info.get("name") != timeline_name:
+        return {}
+    return info
+
+
+def _get_app():
+    """Return the process-wide QApplication, creating it on first use."""
+    global _APP
+    if _APP is None:
+        from PySide6.QtWidgets import QApplication
+        _APP = QApplication.instance()
+        if _APP is None:
+            # Only argv[0]: keep Qt from parsing our own CLI flags
+            _APP = QApplication(sys.argv[:1])
+        install_global_stylesheet, = _lazy('ui.styles', 'install_global_stylesheet')
+        install_global_stylesheet(_APP)
+    return _APP
+
 
 def cmd_transcribe(args):
     """Handle the transcribe command."""
@@ -43,26 +96,23 @@ def cmd_transcribe(args):
     if not args.input:
         return json_response(False, error="--input is required when not using --show-ui")
     
-    input_path = Path(args.input).resolve()
+    # One stat; transcribe_video resolves both paths itself
+    input_path = Path(args.input)
     
-    if not input_path.exists():
+    if not input_path.is_file():
         return json_response(False, error=f"Input file not found: {input_path}")
     
     # Determine output path
     if args.output:
-        output_path = Path(args.output).resolve()
+        output_path = Path(args.output)
     else:
         output_path = input_path.with_suffix(".srt")
     
     try:
         # Lazy import to avoid heavy startup cost
-        if args.show_ui:
-            pass  # transcribe_with_ui will import on demand
-        else:
-            if __package__:
-                from .transcribe import transcribe_video  # noqa: F401
-            else:
-                from core.transcribe import transcribe_video  # noqa: F401
+        # (transcribe_with_ui imports on demand)
+        if not args.show_ui:
+            _lazy('transcribe', 'transcribe_video')
 
         if args.show_ui:
             # Show GUI for transcription with input file
@@ -90,6 +140,22 @@ def cmd_transcribe(args):
         return json_response(False, error=str(e))
 
 
+def _transcribe_kwargs(settings: dict, output_path: Path) -> dict:
+    """Map a settings dict from TranscribeWindow to transcribe_video kwargs."""
+    word_timestamps = bool(settings.get('word_timestamps'))
+    return {
+        'model_name': settings['model'],
+        'device': settings['device'],
+        'language': settings.get('language'),
+        'compute_type': settings.get('compute_type', 'default'),
+        'beam_size': settings.get('beam_size', 1),
+        'word_timestamps': word_timestamps,
+        'vad_min_silence_ms': settings.get('vad_min_silence_ms', 700),
+        # Word timings only end up in the JSONL sidecar
+        'output_jsonl': output_path.with_suffix('.jsonl') if word_timestamps else None,
+    }
+
+
 def transcribe_with_ui(
     input_path: Path,
     output_path: Path,
@@ -106,22 +172,28 @@ def transcribe_with_ui(
     Returns:
         TranscriptionResult or None if cancelled
     """
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    _get_app()
     
-    # Estimate duration for timeline info (simplified)
+    # Timeline info from the Resolve launcher, else probe the video itself
     timeline_info = {
         "name": timeline_name or input_path.stem,
-        "duration": "Unknown",  # Would need to probe video
+        "duration": "Unknown",
         "fps": "24.00"
     }
+    timeline_info.update(_launcher_timeline_info(timeline_name))
+    if timeline_info["duration"] == "Unknown":
+        probe_duration, format_duration = _lazy('utils', 'probe_duration', 'format_duration')
+        seconds = probe_duration(input_path)
+        if seconds is not None:
+            timeline_info["duration"] = format_duration(seconds)
     
     # Lazy import UI components (lightweight) only when needed
-    if __package__:
-        from .ui import TranscribeWindow, ProgressWindow, ResultDialog  # type: ignore
-    else:
-        from core.ui import TranscribeWindow, ProgressWindow, ResultDialog  # type: ignore
+    TranscribeWindow, ProgressWindow, TranscribeWorker = _lazy(
+        'ui', 'TranscribeWindow', 'ProgressWindow', 'TranscribeWorker'
+    )
+    show_success_dialog, show_error_dialog = _lazy(
+        'ui.result_dialog', 'show_success_dialog', 'show_error_dialog'
+    )
 
     # Show settings window
     settings_window = TranscribeWindow(timeline_info)
@@ -150,20 +222,16 @@ def transcribe_with_ui(
             import tempfile as _tempfile
             temp_dir = _Path(_tempfile.gettempdir()) / "resolve-ai-helper"
             temp_dir.mkdir(parents=True, exist_ok=True)
-            from .cli import cmd_generate_test_srt  # self-call
             class _Args: pass
             a = _Args()
             a.output = str(temp_dir / "test_from_ui.srt")
             resp_json = cmd_generate_test_srt(a)
             # Parse and show success dialog
-            import json as _json
-            resp = _json.loads(resp_json)
+            resp = json.loads(resp_json)
             srt_path = resp.get("srt_path") if resp.get("success") else None
-            result_dialog = ResultDialog({"srt_path": srt_path, "duration": 5, "language": "en", "segments_count": 2, "words_count": 6}, success=True)
-            result_dialog.exec()
+            show_success_dialog({"srt_path": srt_path, "duration": 5, "language": "en", "segments_count": 2, "words_count": 6})
         except Exception as e:
-            error_dialog = ResultDialog({"error": str(e)}, success=False)
-            error_dialog.exec()
+            show_error_dialog(str(e))
         return None
 
     # Settings window closed, check if we have settings
@@ -173,78 +241,48 @@ def transcribe_with_ui(
     # Show progress window
     progress_window = ProgressWindow(timeline_info['name'])
     
-    # Track cancellation
-    cancelled = False
-    
-    def on_cancel():
-        nonlocal cancelled
-        cancelled = True
-    
-    progress_window.cancel_requested.connect(on_cancel)
-    
-    # Transcription result container
-    result_container = {'result': None, 'error': None}
+    # Transcribe on a worker thread; the event loop keeps the UI responsive
+    worker = TranscribeWorker(
+        input_path,
+        output_path,
+        **_transcribe_kwargs(settings, output_path)
+    )
+    worker.progress.connect(progress_window.update_progress)
+    progress_window.cancel_requested.connect(worker.cancel)
     
-    # Run transcription in a way that allows UI updates
-    def progress_callback(message: str, progress: Optional[float]):
-        if cancelled:
-            raise InterruptedError("Transcription cancelled by user")
-        
-        progress_window.update_progress(message, progress)
-        QApplication.processEvents()  # Allow UI to update
+    progress_window.show()
+    worker.run_and_wait()
     
-    try:
-        progress_window.show()
-        QApplication.processEvents()
-        
-        # Lazy import the heavy transcribe function at the moment it's needed
-        if __package__:
-            from .transcribe import transcribe_video  # type: ignore
-        else:
-            from core.transcribe import transcribe_video  # type: ignore
-
-        result = transcribe_video(
-            input_path,
-            output_path,
-            model_name=settings['model'],
-            device=settings['device'],
-            language=settings['language'],
-            progress_callback=progress_callback
-        )
-        
-        # Update final stats
-        progress_window.update_stats(
-            segments=result.segments_count,
-            words=result.words_count,
-            language=result.language
-        )
-        
-        progress_window.mark_complete()
-        progress_window.exec()
-        
-        # Show result dialog
-        result_dialog = ResultDialog(result.to_dict(), success=True)
-        result_dialog.exec()
-        
-        result_container['result'] = result
-        
-    except InterruptedError:
+    if worker.cancelled:
         progress_window.mark_error("Transcription cancelled by user")
         progress_window.exec()
         return None
-        
-    except Exception as e:
-        error_msg = str(e)
+    
+    if worker.error is not None:
+        error_msg = worker.error
         progress_window.mark_error(error_msg)
         progress_window.exec()
         
         # Show error dialog
-        error_dialog = ResultDialog({"error": error_msg}, success=False)
-        error_dialog.exec()
-        
-        result_container['error'] = error_msg
+        show_error_dialog(error_msg)
+        return None
+    
+    result = worker.result
     
-    return result_container['result']
+    # Update final stats
+    progress_window.update_stats(
+        segments=result.segments_count,
+        words=result.words_count,
+        language=result.language
+    )
+    
+    progress_window.mark_complete()
+    progress_window.exec()
+    
+    # Show result dialog
+    show_success_dialog(result.to_dict())
+    
+    return result
 
 
 def transcribe_headless(
@@ -274,10 +312,7 @@ def transcribe_headless(
             print(f"[INFO] {message}", file=sys.stderr)
     
     # Lazy import heavy dependency here
-    if __package__:
-        from .transcribe import transcribe_video  # type: ignore
-    else:
-        from core.transcribe import transcribe_video  # type: ignore
+    transcribe_video, = _lazy('transcribe', 'transcribe_video')
 
     result = transcribe_video(
         input_path,
@@ -294,10 +329,9 @@ def transcribe_headless(
 def cmd_check_models(args):
     """Handle the check-models command."""
     # Lazy import to avoid pulling in faster-whisper unless requested
-    if __package__:
-        from .model_manager import ModelManager, print_model_info  # type: ignore
-    else:
-        from core.model_manager import ModelManager, print_model_info  # type: ignore
+    ModelManager, print_model_info = _lazy(
+        'model_manager', 'ModelManager', 'print_model_info'
+    )
 
     manager = ModelManager()
     models_info = manager.list_available_models()
@@ -316,10 +350,9 @@ def cmd_check_models(args):
 
 def cmd_check_system(args):
     """Handle the check-system command."""
-    if __package__:
-        from .utils import check_ffmpeg_available, check_cuda_available  # type: ignore
-    else:
-        from core.utils import check_ffmpeg_available, check_cuda_available  # type: ignore
+    check_ffmpeg_available, check_cuda_available = _lazy(
+        'utils', 'check_ffmpeg_available', 'check_cuda_available'
+    )
 
     ffmpeg_available = check_ffmpeg_available()
     cuda_available = check_cuda_available()
@@ -342,8 +375,10 @@ def cmd_check_system(args):
 
 def cmd_transcribe_ui(args):
     """Handle transcribe command with UI."""
+    from PySide6.QtWidgets import QMessageBox
+
     # Launch GUI
-    app = QApplication(sys.argv)
+    app = _get_app()
     
     # Prepare timeline info for UI
     timeline_info = {
@@ -351,12 +386,15 @@ def cmd_transcribe_ui(args):
         "duration": "Unknown",
         "fps": "Unknown"
     }
+    timeline_info.update(_launcher_timeline_info(args.timeline_name))
     
     # Create and show main window (import UI lazily)
-    if __package__:
-        from .ui import TranscribeWindow, ProgressWindow, ResultDialog  # type: ignore
-    else:
-        from core.ui import TranscribeWindow, ProgressWindow, ResultDialog  # type: ignore
+    TranscribeWindow, ProgressWindow, TranscribeWorker = _lazy(
+        'ui', 'TranscribeWindow', 'ProgressWindow', 'TranscribeWorker'
+    )
+    show_success_dialog, show_error_dialog = _lazy(
+        'ui.result_dialog', 'show_success_dialog', 'show_error_dialog'
+    )
 
     main_window = TranscribeWindow(timeline_info)
     
@@ -371,13 +409,11 @@ def cmd_transcribe_ui(args):
         # Get input file from settings
         input_file = settings.get('input_file')
         if not input_file:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(main_window, "No File", "Please select a video file first!")
             return
         
         input_path = Path(input_file)
         if not input_path.exists():
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(main_window, "File Not Found", f"File not found: {input_path}")
             return
         
@@ -393,28 +429,21 @@ def cmd_transcribe_ui(args):
         
         # Show progress window
         progress_window = ProgressWindow(timeline_info['name'])
-        progress_window.show()
         
-        def progress_callback(message: str, progress: Optional[float]):
-            progress_window.update_progress(message, progress or 0.0)
-            QApplication.processEvents()
+        # Transcribe on a worker thread; the event loop keeps the UI responsive
+        worker = TranscribeWorker(
+            input_path,
+            output_path,
+            **_transcribe_kwargs(settings, output_path)
+        )
+        worker.progress.connect(progress_window.update_progress)
+        progress_window.cancel_requested.connect(worker.cancel)
         
-        try:
-            # Perform transcription
-            # Import heavy transcribe only when user starts the job
-            if __package__:
-                from .transcribe import transcribe_video  # type: ignore
-            else:
-                from core.transcribe import transcribe_video  # type: ignore
-
-            result = transcribe_video(
-                input_path,
-                output_path,
-                model_name=settings['model'],
-                device=settings['device'],
-                language=settings.get('language'),
-                progress_callback=progress_callback
-            )
+        progress_window.show()
+        worker.run_and_wait()
+        
+        if worker.error is None:
+            result = worker.result
             
             # Update progress with stats
             progress_window.update_stats(
@@ -427,8 +456,7 @@ def cmd_transcribe_ui(args):
             progress_window.close()
             
             # Show result dialog
-            result_dialog = ResultDialog(result.__dict__, success=True)
-            result_dialog.exec()
+            show_success_dialog(result.__dict__)
             
             # Emit JSON on stdout when interactive
             if interactive:
@@ -436,13 +464,11 @@ def cmd_transcribe_ui(args):
             
             transcription_result["completed"] = True
             transcription_result["result"] = result
-            
-        except Exception as e:
+        else:
             progress_window.close()
-            result_dialog = ResultDialog({"error": str(e)}, success=False)
-            result_dialog.exec()
+            show_error_dialog(worker.error)
             if interactive:
-                print(json_response(False, error=str(e)), flush=True)
+                print(json_response(False, error=worker.error), flush=True)
         
         if not interactive:
             app.quit()
@@ -474,18 +500,34 @@ def cmd_transcribe_ui(args):
     # Interactive mode: keep UI open and listen for JSON commands on stdin
     interactive = getattr(args, 'interactive', False)
     if interactive:
-        main_window.set_keep_open(True)
-        commands_q = _queue.Queue()
+        import queue
+        import socket
+        from threading import Thread
+
+        main_window.keep_open = True
+        commands_q = queue.Queue()
+        # Self-pipe: the reader thread writes a byte per command so the Qt
+        # event loop wakes only when there is work
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+
+        # orjson parses in C when available; json.loads accepts bytes too
+        try:
+            from orjson import loads as _loads
+        except ImportError:
+            _loads = json.loads
 
         def stdin_reader():
             try:
-                for line in _sys.stdin:
+                # Binary stdin: bytes go straight to the parser, no text decode
+                for line in sys.stdin.buffer:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        cmd = _json.loads(line)
+                        cmd = _loads(line)
                         commands_q.put(cmd)
+                        wake_w.send(b"\0")
                     except Exception:
                         # Ignore malformed lines
                         continue
@@ -495,7 +537,7 @@ def cmd_transcribe_ui(args):
         reader_t = Thread(target=stdin_reader, daemon=True)
         reader_t.start()
 
-        from PySide6.QtCore import QTimer
+        from PySide6.QtCore import QSocketNotifier
         # Signals to update UI from events
         from PySide6.QtCore import Signal, QObject
         class _EventBus(QObject):
@@ -505,57 +547,71 @@ def cmd_transcribe_ui(args):
         bus.timeline_event.connect(main_window.update_timeline_context)
         bus.selection_event.connect(main_window.update_selection)
 
+        def _do_transcribe(cmd):
+            # Build settings dict to reuse on_transcribe_requested
+            on_transcribe_requested({
+                'input_file': cmd.get('input'),
+                'model': cmd.get('model', 'base'),
+                'device': cmd.get('device', 'auto'),
+                'language': cmd.get('language'),
+                'compute_type': cmd.get('compute_type', 'default'),
+                'beam_size': cmd.get('beam_size', 1),
+                'word_timestamps': cmd.get('word_timestamps', False),
+                'vad_min_silence_ms': cmd.get('vad_min_silence_ms', 700),
+            })
+
+        def _do_cancel(cmd):
+            print(_CANCEL_JSON)
+
+        def _do_shutdown(cmd):
+            app.quit()
+            return True  # Stop draining the queue
+
+        # Event messages from supervisor: event -> (emit, payload key, default)
+        event_table = {
+            'timeline_state': (bus.timeline_event.emit, 'timeline', dict),
+            'selection': (bus.selection_event.emit, 'items', list),
+        }
+        # Command messages intended for actions
+        cmd_table = {
+            'test_place': lambda cmd: on_test_place(),
+            'transcribe': _do_transcribe,
+            # For now treat same as transcribe; supervisor will export range to a file
+            'transcribe_range': _do_transcribe,
+            'cancel': _do_cancel,
+            'shutdown': _do_shutdown,
+        }
+
         def poll_commands():
+            # Drain wake-up bytes first so commands queued meanwhile re-arm us
+            try:
+                wake_r.recv(4096)
+            except BlockingIOError:
+                pass
             try:
                 while True:
                     cmd = commands_q.get_nowait()
-                    # Event messages from supervisor
-                    if cmd.get('event') == 'timeline_state':
-                        bus.timeline_event.emit(cmd.get('timeline') or {})
-                        continue
-                    if cmd.get('event') == 'selection':
-                        bus.selection_event.emit(cmd.get('items') or [])
+                    event = event_table.get(cmd.get('event'))
+                    if event is not None:
+                        emit, key, default = event
+                        emit(cmd.get(key) or default())
                         continue
-                    # Command messages intended for actions
-                    ctype = cmd.get('cmd')
-                    if ctype == 'test_place':
-                        on_test_place()
-                    elif ctype == 'transcribe':
-                        # Build settings dict to reuse on_transcribe_requested
-                        settings = {
-                            'input_file': cmd.get('input'),
-                            'model': cmd.get('model', 'base'),
-                            'device': cmd.get('device', 'auto'),
-                            'language': cmd.get('language'),
-                        }
-                        on_transcribe_requested(settings)
-                    elif ctype == 'transcribe_range':
-                        # For now treat same as transcribe; supervisor will export range to a file
-                        settings = {
-                            'input_file': cmd.get('input'),
-                            'model': cmd.get('model', 'base'),
-                            'device': cmd.get('device', 'auto'),
-                            'language': cmd.get('language'),
-                        }
-                        on_transcribe_requested(settings)
-                    elif ctype == 'cancel':
-                        print(json_response(False, error='cancel'))
-                    elif ctype == 'shutdown':
-                        app.quit()
+                    handler = cmd_table.get(cmd.get('cmd'))
+                    if handler is not None and handler(cmd):
                         return
-            except _queue.Empty:
+            except queue.Empty:
                 pass
 
-        timer = QTimer(main_window)
-        timer.timeout.connect(poll_commands)
-        timer.start(200)
+        notifier = QSocketNotifier(wake_r.fileno(), QSocketNotifier.Type.Read, main_window)
+        notifier.activated.connect(lambda *_: poll_commands())
 
         # Keep strong references so GC doesn't stop polling
         main_window._interactive = True
         main_window._cmd_queue = commands_q
         main_window._stdin_thread = reader_t
         main_window._event_bus = bus
-        main_window._event_timer = timer
+        main_window._wake_sockets = (wake_r, wake_w)
+        main_window._cmd_notifier = notifier
     main_window.show()
     
     app.exec()
@@ -571,7 +627,7 @@ def cmd_transcribe_ui(args):
         if test_requested["value"] and test_response_json["value"]:
             return test_response_json["value"]
         if cancel_requested["value"]:
-            return json_response(False, error="cancel")
+            return _CANCEL_JSON
         return json_response(False, error="Transcription cancelled by user")
 
 
@@ -590,16 +646,7 @@ def cmd_generate_test_srt(args):
         srt_path = temp_dir / "test_from_exe.srt"
 
     # Write a minimal SRT
-    content = (
-        "1\n"
-        "00:00:00,000 --> 00:00:02,500\n"
-        "Hello from resolve_ai_helper.exe!\n\n"
-        "2\n"
-        "00:00:02,700 --> 00:00:05,000\n"
-        "This verifies the exe → Resolve roundtrip.\n\n"
-    )
-    with srt_path.open('w', encoding='utf-8') as f:
-        f.write(content)
+    srt_path.write_bytes(_TEST_SRT_BYTES)
 
     return json_response(True, data={"srt_path": str(srt_path)})
 
@@ -609,36 +656,8 @@ def cmd_version(args):
     return __version__
 
 
-def main():
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        description="Resolve AI Helper - AI-powered transcription for DaVinci Resolve",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Transcribe with GUI
-  resolve_ai_helper transcribe --input video.mp4 --show-ui --timeline-name "My Video"
-  
-  # Transcribe headless
-  resolve_ai_helper transcribe --input video.mp4 --model base --device auto
-  
-  # Check available models
-  resolve_ai_helper check-models
-  
-  # Check system requirements
-  resolve_ai_helper check-system
-        """
-    )
-    
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'Resolve AI Helper v{__version__}'
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    
-    # Transcribe command
+def _build_transcribe_parser(subparsers):
+    """Add the transcribe subcommand."""
     transcribe_parser = subparsers.add_parser(
         'transcribe',
         help='Transcribe video to subtitles'
@@ -683,8 +702,10 @@ Examples:
         help='Name of the timeline (for UI display)'
     )
     transcribe_parser.set_defaults(func=cmd_transcribe)
-    
-    # Check models command
+
+
+def _build_check_models_parser(subparsers):
+    """Add the check-models subcommand."""
     models_parser = subparsers.add_parser(
         'check-models',
         help='List available Whisper models'
@@ -695,8 +716,10 @@ Examples:
         help='Output as JSON'
     )
     models_parser.set_defaults(func=cmd_check_models)
-    
-    # Check system command
+
+
+def _build_check_system_parser(subparsers):
+    """Add the check-system subcommand."""
     system_parser = subparsers.add_parser(
         'check-system',
         help='Check system requirements'
@@ -708,7 +731,9 @@ Examples:
     )
     system_parser.set_defaults(func=cmd_check_system)
 
-    # Generate test SRT command (for Resolve integration testing)
+
+def _build_generate_test_srt_parser(subparsers):
+    """Add the generate-test-srt subcommand (for Resolve integration testing)."""
     test_srt_parser = subparsers.add_parser(
         'generate-test-srt',
         help='Generate a small SRT file and print its path as JSON'
@@ -718,9 +743,79 @@ Examples:
         help='Optional output path for the generated SRT'
     )
     test_srt_parser.set_defaults(func=cmd_generate_test_srt)
+
+
+# Subcommand name -> parser builder, in help order
+_SUBCOMMAND_BUILDERS = {
+    'transcribe': _build_transcribe_parser,
+    'check-models': _build_check_models_parser,
+    'check-system': _build_check_system_parser,
+    'generate-test-srt': _build_generate_test_srt_parser,
+}
+
+
+def build_parser(commands=None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+    
+    Args:
+        commands: Subcommand names to include, or None for all of them
+    
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Resolve AI Helper - AI-powered transcription for DaVinci Resolve",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Transcribe with GUI
+  resolve_ai_helper transcribe --input video.mp4 --show-ui --timeline-name "My Video"
+  
+  # Transcribe headless
+  resolve_ai_helper transcribe --input video.mp4 --model base --device auto
+  
+  # Check available models
+  resolve_ai_helper check-models
+  
+  # Check system requirements
+  resolve_ai_helper check-system
+        """
+    )
+    
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'Resolve AI Helper v{__version__}'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    for name, builder in _SUBCOMMAND_BUILDERS.items():
+        if commands is None or name in commands:
+            builder(subparsers)
+    
+    return parser
+
+
+def main():
+    """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+    
+    # Fast path: --version needs no parser at all
+    if argv[:1] == ['--version']:
+        print(f'Resolve AI Helper v{__version__}')
+        sys.exit(0)
+    
+    # Only build the requested subcommand's parser; --help, unknown or
+    # missing commands fall through to the full parser
+    command = argv[0] if argv else None
+    if command in _SUBCOMMAND_BUILDERS:
+        parser = build_parser((command,))
+    else:
+        parser = build_parser()
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
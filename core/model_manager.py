@@ -4,26 +4,79 @@
 Model Manager for downloading and caching Whisper models
 """
 
+import gc
+import os
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable
-from faster_whisper import WhisperModel
-from .utils import get_models_dir
+from typing import Optional, Callable, TYPE_CHECKING
+from .utils import get_available_memory, get_models_dir
+
+# faster-whisper (and CTranslate2/numpy behind it) is imported only when a
+# model is actually built, so the UI can use ModelManager metadata cheaply.
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+# Note an unreadable RAM size once rather than on every recommendation
+_RAM_PROBE_WARNED = False
+
+
+@lru_cache(maxsize=2)
+def _get_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    download_root: str
+) -> "WhisperModel":
+    """Construct a WhisperModel; cached so repeat transcriptions reuse it."""
+    from faster_whisper import WhisperModel
+    
+    # On CPU, give CTranslate2's int8 kernels every core
+    cpu_kwargs = {}
+    if device == "cpu":
+        cpu_kwargs = {"cpu_threads": os.cpu_count() or 0, "num_workers": 1}
+    
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        download_root=download_root,
+        **cpu_kwargs
+    )
 
 
 class ModelManager:
     """Manages Whisper model downloads and caching."""
     
+    # "vram" is the approximate footprint with the CUDA default (int8_float16)
     AVAILABLE_MODELS = {
-        "tiny": {"size": "~75MB", "speed": "fastest", "accuracy": "low"},
-        "base": {"size": "~150MB", "speed": "fast", "accuracy": "good"},
-        "small": {"size": "~500MB", "speed": "moderate", "accuracy": "better"},
-        "medium": {"size": "~1.5GB", "speed": "slow", "accuracy": "best"},
+        "tiny": {"size": "~75MB", "speed": "fastest", "accuracy": "low", "vram": "~0.3GB"},
+        "base": {"size": "~150MB", "speed": "fast", "accuracy": "good", "vram": "~0.4GB"},
+        "small": {"size": "~500MB", "speed": "moderate", "accuracy": "better", "vram": "~0.8GB"},
+        "medium": {"size": "~1.5GB", "speed": "slow", "accuracy": "best", "vram": "~1.8GB"},
     }
     
+    # How long a failed conversion is remembered before it is tried again
+    CONVERT_RETRY_SECONDS = 7 * 24 * 3600
+    
+    # CUDA availability, probed once per process (None = not checked yet)
+    _HAS_CUDA = None
+    
     def __init__(self):
         self.models_dir = get_models_dir()
     
+    @classmethod
+    def has_cuda(cls) -> bool:
+        """Check whether CTranslate2 can see a CUDA device (cached)."""
+        if cls._HAS_CUDA is None:
+            try:
+                import ctranslate2
+                cls._HAS_CUDA = ctranslate2.get_cuda_device_count() > 0
+            except Exception:
+                cls._HAS_CUDA = False
+        return cls._HAS_CUDA
+    
     def is_model_cached(self, model_name: str) -> bool:
         """Check if a model is already downloaded and cached."""
         if model_name not in self.AVAILABLE_MODELS:
@@ -48,14 +101,15 @@ class ModelManager:
         device: str = "auto",
         compute_type: str = "default",
         progress_callback: Optional[Callable[[str], None]] = None
-    ) -> WhisperModel:
+    ) -> "WhisperModel":
         """
         Load a Whisper model, downloading if necessary.
         
         Args:
             model_name: Name of the model (tiny, base, small, medium)
             device: Device to use ("cpu", "cuda", or "auto")
-            compute_type: Computation type ("int8", "float16", "float32", or "default")
+            compute_type: Computation type ("int8", "int8_float16", "float16",
+                "float32", or "default")
             progress_callback: Optional callback for progress updates
         
         Returns:
@@ -73,20 +127,15 @@ class ModelManager:
         
         # Auto-detect device if needed
         if device == "auto":
-            try:
-                import torch
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                if progress_callback:
-                    progress_callback(f"Auto-detected device: {device.upper()}")
-            except ImportError:
-                device = "cpu"
-                if progress_callback:
-                    progress_callback("PyTorch not available, using CPU")
+            device = "cuda" if self.has_cuda() else "cpu"
+            if progress_callback:
+                progress_callback(f"Auto-detected device: {device.upper()}")
         
         # Auto-select compute type based on device
         if compute_type == "default":
             if device == "cuda":
-                compute_type = "float16"
+                # int8 weights, fp16 activations: half the weight bandwidth
+                compute_type = "int8_float16"
             else:
                 compute_type = "int8"
         
@@ -98,11 +147,11 @@ class ModelManager:
             progress_callback("This may take a moment on first run (downloading model)")
         
         try:
-            model = WhisperModel(
-                model_name,
-                device=device,
-                compute_type=compute_type,
-                download_root=str(self.models_dir)
+            model_path = self.ensure_converted(
+                model_name, compute_type, progress_callback
+            )
+            model = _get_model(
+                model_path, device, compute_type, str(self.models_dir)
             )
             
             if progress_callback:
@@ -116,6 +165,92 @@ class ModelManager:
                 progress_callback(f"✗ {error_msg}")
             raise RuntimeError(error_msg)
     
+    def ensure_converted(
+        self,
+        model_name: str,
+        compute_type: str,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Get a pre-quantized CTranslate2 directory for a model, converting once.
+        
+        Weights are written in their final layout under
+        <models_dir>/<model>-<compute_type>, so later loads skip the
+        load-time quantization. Conversion needs ct2-transformers-converter
+        (transformers + torch); without it the bare model name is returned
+        and faster-whisper downloads into models_dir as before. A failed
+        conversion leaves a "<model>-<compute_type>.failed" marker (holding
+        the converter's error) and is skipped for CONVERT_RETRY_SECONDS.
+        
+        Args:
+            model_name: Name of the model (tiny, base, small, medium)
+            compute_type: Resolved computation type (not "default")
+            progress_callback: Optional callback for progress updates
+        
+        Returns:
+            Model directory path, or model_name if conversion is unavailable
+        """
+        import shutil
+        import subprocess
+        
+        target = self.models_dir / f"{model_name}-{compute_type}"
+        if (target / "model.bin").is_file():
+            return str(target)
+        
+        # A recent failure is not retried: each attempt re-downloads the
+        # full Hugging Face checkpoint before failing again
+        failed_marker = target.with_name(target.name + ".failed")
+        try:
+            if time.time() - failed_marker.stat().st_mtime < self.CONVERT_RETRY_SECONDS:
+                return model_name
+        except OSError:
+            pass
+        
+        converter = shutil.which("ct2-transformers-converter")
+        if converter is None:
+            return model_name
+        
+        if progress_callback:
+            progress_callback(f"Converting {model_name} to {compute_type} (one-time)...")
+        
+        try:
+            subprocess.run(
+                [
+                    converter,
+                    "--model", f"openai/whisper-{model_name}",
+                    "--output_dir", str(target),
+                    "--quantization", compute_type,
+                    "--copy_files", "tokenizer.json",
+                ],
+                check=True,
+                capture_output=True
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            detail = getattr(e, "stderr", None)
+            if isinstance(detail, bytes):
+                detail = detail.decode("utf-8", errors="replace")
+            detail = (detail or str(e)).strip()
+            print(
+                f"[WARN] Converting {model_name} to {compute_type} failed; "
+                f"loading {model_name} directly:\n{detail}",
+                file=sys.stderr
+            )
+            if progress_callback:
+                progress_callback(f"Conversion failed, loading {model_name} directly...")
+            shutil.rmtree(target, ignore_errors=True)
+            try:
+                failed_marker.write_text(detail, encoding="utf-8")
+            except OSError:
+                pass
+            return model_name
+        
+        return str(target)
+    
+    def evict(self):
+        """Release cached models (e.g. before loading a larger one on a small GPU)."""
+        _get_model.cache_clear()
+        gc.collect()
+    
     def list_available_models(self) -> dict:
         """List all available models with their information."""
         return self.AVAILABLE_MODELS.copy()
@@ -156,10 +291,42 @@ class ModelManager:
         factor = speed_factors[model_name][device]
         return duration_seconds * factor
     
+    @staticmethod
+    def get_memory_cap() -> Optional[str]:
+        """
+        Get the largest model that fits in currently available RAM.
+        
+        Returns:
+            Model name, or None if available RAM can't be determined
+        """
+        global _RAM_PROBE_WARNED
+        avail = get_available_memory()
+        if avail is None:
+            if not _RAM_PROBE_WARNED:
+                _RAM_PROBE_WARNED = True
+                print(
+                    "[INFO] Available RAM unknown; model recommendation "
+                    "ignores it",
+                    file=sys.stderr
+                )
+            return None
+        
+        avail_gb = avail / 1e9
+        if avail_gb < 2:
+            return "tiny"
+        elif avail_gb < 4:
+            return "base"
+        elif avail_gb < 8:
+            return "small"
+        return "medium"
+    
     def get_recommended_model(self, duration_minutes: float, has_gpu: bool = False) -> str:
         """
         Recommend a model based on video duration and hardware.
         
+        The duration-based choice is clamped to what fits in available RAM,
+        so low-memory machines are not pushed into swapping.
+        
         Args:
             duration_minutes: Video duration in minutes
             has_gpu: Whether GPU is available
@@ -169,13 +336,21 @@ class ModelManager:
         """
         if duration_minutes < 5:
             # Short videos: use better quality
-            return "small" if has_gpu else "base"
+            model = "small" if has_gpu else "base"
         elif duration_minutes < 30:
             # Medium videos: balance speed and quality
-            return "base"
+            model = "base"
         else:
             # Long videos: prioritize speed
-            return "tiny" if not has_gpu else "base"
+            model = "tiny" if not has_gpu else "base"
+        
+        cap = self.get_memory_cap()
+        if cap is not None:
+            order = list(self.AVAILABLE_MODELS)
+            if order.index(model) > order.index(cap):
+                model = cap
+        
+        return model
 
 
 def print_model_info():
@@ -189,6 +364,7 @@ def print_model_info():
         print(f"  Size:     {info['size']}")
         print(f"  Speed:    {info['speed']}")
         print(f"  Accuracy: {info['accuracy']}")
+        print(f"  VRAM:     {info['vram']}")
     
     print("\n" + "-" * 60)
     print("Recommended: 'base' for most use cases")
@@ -5,21 +5,35 @@ Core transcription functionality using faster-whisper
 """
 
 import json
+import os
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 from .model_manager import ModelManager
 from .utils import (
-    extract_audio,
-    format_srt_timestamp,
-    validate_video_file,
-    get_temp_dir,
-    cleanup_temp_files
+    extract_audio_pcm,
+    format_srt_timestamps,
+    has_video_extension
 )
 
 
+# Default VAD settings, shared by every call that doesn't override them
+_VAD_MIN_SILENCE_MS = 700
+_VAD_PARAMS = {"min_silence_duration_ms": _VAD_MIN_SILENCE_MS}
+
+
 class TranscriptionResult:
     """Container for transcription results."""
     
@@ -51,6 +65,13 @@ class TranscriptionResult:
         }
 
 
+def _absolute(path) -> Path:
+    """Return path as an absolute Path, resolving only when it is relative."""
+    if isinstance(path, Path) and path.is_absolute():
+        return path
+    return Path(path).resolve()
+
+
 def transcribe_video(
     video_path: Path,
     output_srt: Optional[Path] = None,
@@ -58,9 +79,12 @@ def transcribe_video(
     device: str = "auto",
     compute_type: str = "default",
     language: Optional[str] = None,
-    word_timestamps: bool = True,
+    word_timestamps: bool = False,
     vad_filter: bool = True,
-    progress_callback: Optional[Callable[[str, Optional[float]], None]] = None
+    vad_min_silence_ms: int = _VAD_MIN_SILENCE_MS,
+    beam_size: int = 1,
+    progress_callback: Optional[Callable[[str, Optional[float]], None]] = None,
+    output_jsonl: Optional[Path] = None
 ) -> TranscriptionResult:
     """
     Transcribe video file to SRT subtitles.
@@ -72,9 +96,14 @@ def transcribe_video(
         device: Device to use ("cpu", "cuda", or "auto")
         compute_type: Computation type ("int8", "float16", "float32", or "default")
         language: Language code (e.g., "en", "es") or None for auto-detect
-        word_timestamps: Whether to generate word-level timestamps
+        word_timestamps: Whether to generate word-level timestamps (only
+            useful with output_jsonl; SRT output ignores them)
         vad_filter: Whether to use Voice Activity Detection
+        vad_min_silence_ms: Silence (ms) that splits speech when VAD is on;
+            lower values drop more non-speech audio before the encoder
+        beam_size: Decoder beam width (1 = greedy, fastest)
         progress_callback: Optional callback(message: str, progress: Optional[float])
+        output_jsonl: Optional path for a JSONL dump of segments (with words)
     
     Returns:
         TranscriptionResult object
@@ -84,14 +113,14 @@ def transcribe_video(
         ValueError: If video file format is invalid
         RuntimeError: If transcription fails
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     
-    # Validate input
-    video_path = Path(video_path).resolve()
+    # Validate input (one stat for existence; the extension check is pure)
+    video_path = _absolute(video_path)
     if not video_path.exists():
         raise FileNotFoundError(f"Video file not found: {video_path}")
     
-    if not validate_video_file(video_path):
+    if not has_video_extension(video_path):
         raise ValueError(
             f"Invalid video file format: {video_path.suffix}\n"
             "Supported formats: .mp4, .mov, .avi, .mkv, .mxf, .m4v, .webm"
@@ -101,97 +130,116 @@ def transcribe_video(
     if output_srt is None:
         output_srt = video_path.with_suffix(".srt")
     else:
-        output_srt = Path(output_srt).resolve()
+        output_srt = _absolute(output_srt)
     
     # Ensure output directory exists
     output_srt.parent.mkdir(parents=True, exist_ok=True)
     
+    # Model loading reports progress from a worker thread
+    progress_lock = threading.Lock()
+    
     try:
-        # Step 1: Extract audio
+        # Steps 1 & 2: Extract audio and load the model concurrently
+        # (ffmpeg decode overlaps model download/initialization)
         if progress_callback:
             progress_callback("Extracting audio from video...", 0.0)
-        
-        temp_dir = get_temp_dir()
-        audio_path = temp_dir / f"{video_path.stem}_audio.wav"
-        audio_path = extract_audio(video_path, audio_path)
-        
-        # Step 2: Load model
-        if progress_callback:
             progress_callback("Loading Whisper model...", 0.1)
         
         manager = ModelManager()
         
+        # Set once this call has failed; a still-running load goes quiet
+        abandoned = threading.Event()
+        
         def model_progress(msg: str):
-            if progress_callback:
-                progress_callback(msg, None)
+            if progress_callback and not abandoned.is_set():
+                with progress_lock:
+                    progress_callback(msg, None)
         
-        model = manager.load_model(
-            model_name,
-            device=device,
-            compute_type=compute_type,
-            progress_callback=model_progress
-        )
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            audio_future = executor.submit(extract_audio_pcm, video_path)
+            model_future = executor.submit(
+                manager.load_model,
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                progress_callback=model_progress
+            )
+            audio = audio_future.result()
+            model = model_future.result()
+        except BaseException:
+            # Report e.g. an ffmpeg failure now instead of after a model
+            # download that could take minutes; the load finishes unobserved
+            abandoned.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
         
         # Step 3: Transcribe
         if progress_callback:
             progress_callback("Transcribing audio (this may take a while)...", 0.2)
         
-        segments_list = []
         total_words = 0
+        segments_count = 0
+        next_tick = 0.0
+        
+        vad_parameters = None
+        if vad_filter:
+            vad_parameters = _VAD_PARAMS
+            if vad_min_silence_ms != _VAD_MIN_SILENCE_MS:
+                vad_parameters = {"min_silence_duration_ms": vad_min_silence_ms}
         
         segments, info = model.transcribe(
-            str(audio_path),
+            audio,
             language=language,
             word_timestamps=word_timestamps,
             vad_filter=vad_filter,
-            vad_parameters=dict(min_silence_duration_ms=700) if vad_filter else None,
-            beam_size=5,
+            vad_parameters=vad_parameters,
+            beam_size=beam_size,
             temperature=0.0,
             condition_on_previous_text=False
         )
         
-        # Convert generator to list and process
+        # Segments are written as the generator yields them; nothing is kept
         if progress_callback:
             progress_callback("Processing segments...", 0.3)
         
-        for i, segment in enumerate(segments):
-            seg_data = {
-                "start": float(segment.start),
-                "end": float(segment.end),
-                "text": segment.text.strip()
-            }
-            
-            if word_timestamps and segment.words:
-                seg_data["words"] = [
-                    {
-                        "start": float(w.start),
-                        "end": float(w.end),
-                        "word": w.word
-                    }
-                    for w in segment.words
-                ]
-                total_words += len(segment.words)
+        with ExitStack() as stack:
+            writer = stack.enter_context(SrtWriter(output_srt))
+            jsonl = None
+            if output_jsonl is not None:
+                jsonl = stack.enter_context(Path(output_jsonl).open('wb'))
             
-            segments_list.append(seg_data)
+            # Bind hot-loop lookups once
+            get_fields = attrgetter("start", "end", "text", "words")
+            write_cue = writer.write
+            monotonic = time.monotonic
             
-            # Update progress periodically
-            if progress_callback and i % 10 == 0:
-                progress_callback(
-                    f"Processing segments... ({i} completed)",
-                    0.3 + (0.5 * min(i / 100, 1.0))  # Progress from 30% to 80%
-                )
+            for i, segment in enumerate(segments, start=1):
+                start, end, text, words = get_fields(segment)
+                write_cue(i, start, end, text.strip())
+                # Word timings are off by default; count the text instead
+                total_words += len(words) if words else len(text.split())
+                segments_count = i
+                
+                if jsonl is not None:
+                    jsonl.write(_jsonl_line(segment_to_dict(segment)))
+                
+                # Update progress at most every 100 ms
+                if progress_callback:
+                    now = monotonic()
+                    if now >= next_tick:
+                        progress_callback(
+                            f"Processing segments... ({i} completed)",
+                            0.3 + (0.5 * min(i / 100, 1.0))  # Progress from 30% to 80%
+                        )
+                        next_tick = now + 0.1
         
-        # Step 4: Generate SRT
         if progress_callback:
-            progress_callback("Generating SRT file...", 0.9)
-        
-        write_srt(segments_list, output_srt)
-        
-        # Clean up temporary audio file
-        cleanup_temp_files(audio_path)
+            progress_callback(f"Processed {segments_count} segments", 0.8)
         
         # Calculate processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         if progress_callback:
             progress_callback("✓ Transcription complete!", 1.0)
@@ -200,16 +248,12 @@ def transcribe_video(
             srt_path=output_srt,
             duration=float(getattr(info, 'duration', 0)),
             language=getattr(info, 'language', language or 'unknown'),
-            segments_count=len(segments_list),
+            segments_count=segments_count,
             words_count=total_words,
             processing_time=processing_time
         )
         
     except Exception as e:
-        # Clean up on error
-        if 'audio_path' in locals():
-            cleanup_temp_files(audio_path)
-        
         error_msg = f"Transcription failed: {str(e)}"
         if progress_callback:
             progress_callback(f"✗ {error_msg}", None)
@@ -217,6 +261,108 @@ def transcribe_video(
         raise RuntimeError(error_msg) from e
 
 
+# One SRT cue: index, "start --> end" range, text
+_SRT_TMPL = "{}\n{}\n{}\n\n".format
+
+
+class SrtWriter:
+    """
+    Context manager that writes SRT cues as they arrive.
+    
+    Cues are buffered in batches of FLUSH_EVERY; each batch has its
+    timestamps formatted in one vectorized pass and is written with a
+    single write() call. They go to a sibling temp file that replaces
+    output_path only on a clean exit, so a cancelled or failed run leaves
+    any existing SRT untouched.
+    
+    Example:
+        with SrtWriter(path) as writer:
+            writer.write(1, 0.0, 2.5, "Hello")
+    """
+    
+    FLUSH_EVERY = 1024
+    
+    def __init__(self, output_path: Path):
+        self.output_path = Path(output_path)
+        self._file = None
+        self._indices = []
+        self._starts = []
+        self._ends = []
+        self._texts = []
+    
+    def __enter__(self) -> "SrtWriter":
+        self._file = tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=self.output_path.parent,
+            prefix=f".{self.output_path.name}.",
+            suffix=".tmp",
+            delete=False
+        )
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        tmp_path = self._file.name
+        committed = False
+        try:
+            if exc_type is None:
+                self.flush()
+                self._file.close()
+                os.replace(tmp_path, self.output_path)
+                committed = True
+        finally:
+            if not committed:
+                self._file.close()
+                os.unlink(tmp_path)
+            self._file = None
+    
+    def write(self, idx: int, start: float, end: float, text: str):
+        """Queue one cue; cues with empty text are skipped."""
+        if not text:
+            return
+        
+        self._indices.append(idx)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._texts.append(text)
+        if len(self._indices) >= self.FLUSH_EVERY:
+            self.flush()
+    
+    def flush(self):
+        """Write any queued cues to the file."""
+        if not self._indices:
+            return
+        
+        ranges = format_srt_timestamps(self._starts, self._ends)
+        self._file.write("".join(map(_SRT_TMPL, self._indices, ranges, self._texts)))
+        
+        self._indices.clear()
+        self._starts.clear()
+        self._ends.clear()
+        self._texts.clear()
+
+
+def segment_to_dict(segment) -> Dict[str, Any]:
+    """Convert a faster-whisper segment (and its words) to a plain dict."""
+    seg_data = {
+        "start": float(segment.start),
+        "end": float(segment.end),
+        "text": segment.text.strip()
+    }
+    
+    if segment.words:
+        seg_data["words"] = [
+            {
+                "start": float(w.start),
+                "end": float(w.end),
+                "word": w.word
+            }
+            for w in segment.words
+        ]
+    
+    return seg_data
+
+
 def write_srt(segments: List[Dict[str, Any]], output_path: Path):
     """
     Write segments to SRT subtitle file.
@@ -225,19 +371,21 @@ def write_srt(segments: List[Dict[str, Any]], output_path: Path):
         segments: List of segment dictionaries with 'start', 'end', 'text'
         output_path: Path to output SRT file
     """
-    with output_path.open('w', encoding='utf-8') as f:
+    with SrtWriter(output_path) as writer:
         for i, seg in enumerate(segments, start=1):
-            text = seg.get('text', '').strip()
-            if not text:
-                continue
-            
-            start = seg.get('start', 0.0)
-            end = seg.get('end', 0.0)
-            
-            # Write SRT format
-            f.write(f"{i}\n")
-            f.write(f"{format_srt_timestamp(start)} --> {format_srt_timestamp(end)}\n")
-            f.write(f"{text}\n\n")
+            writer.write(
+                i,
+                seg.get('start', 0.0),
+                seg.get('end', 0.0),
+                seg.get('text', '').strip()
+            )
+
+
+def _jsonl_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize one JSONL record as UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
 
 
 def write_jsonl(segments: List[Dict[str, Any]], output_path: Path):
@@ -248,9 +396,8 @@ def write_jsonl(segments: List[Dict[str, Any]], output_path: Path):
         segments: List of segment dictionaries
         output_path: Path to output JSONL file
     """
-    with output_path.open('w', encoding='utf-8') as f:
-        for seg in segments:
-            f.write(json.dumps(seg, ensure_ascii=False) + '\n')
+    with output_path.open('wb') as f:
+        f.writelines(_jsonl_line(seg) for seg in segments)
 
 
 if __name__ == "__main__":
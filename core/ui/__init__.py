@@ -5,6 +5,7 @@ PySide6 UI Components for Resolve AI Helper
 from .main_window import TranscribeWindow
 from .progress_window import ProgressWindow
 from .result_dialog import ResultDialog
+from .transcribe_worker import TranscribeWorker
 
-__all__ = ["TranscribeWindow", "ProgressWindow", "ResultDialog"]
+__all__ = ["TranscribeWindow", "ProgressWindow", "ResultDialog", "TranscribeWorker"]
 
@@ -4,14 +4,68 @@
 Main transcription settings window - DaVinci Resolve inspired design
 """
 
+from functools import lru_cache
+from html import escape
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QRadioButton, QPushButton,
-    QGroupBox, QButtonGroup, QFrame, QScrollArea
+    QLabel, QComboBox, QRadioButton, QPushButton, QCheckBox, QSpinBox,
+    QGroupBox, QButtonGroup, QFrame, QScrollArea, QGridLayout, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
 
+from ..model_manager import ModelManager
+from ..utils import check_cuda_available
+
+
+# Language combo entries -> Whisper language codes (None = auto-detect)
+_LANG_MAP = {
+    "Auto-detect": None,
+    "English": "en", "Spanish": "es", "French": "fr",
+    "German": "de", "Italian": "it", "Portuguese": "pt",
+    "Chinese": "zh", "Japanese": "ja", "Korean": "ko",
+    "Russian": "ru", "Arabic": "ar"
+}
+
+def _set_if_changed(label: QLabel, text: str):
+    """Set a label's text only if it differs, avoiding a needless relayout."""
+    if label.text() != text:
+        label.setText(text)
+
+
+@lru_cache(maxsize=8)
+def _timeline_info_html(name: str, duration: str, fps: str) -> str:
+    """Render the static timeline info block as a single rich-text table."""
+    row = ("<tr><td width=100 style='color:#909090; padding-bottom:6px'>{}</td>"
+           "<td style=\"font-family:Consolas,'Courier New',monospace\">{}</td></tr>")
+    rows = (("Name:", name), ("Duration:", duration), ("Frame Rate:", fps))
+    body = "".join(row.format(label, escape(str(value))) for label, value in rows)
+    return f"<table cellspacing=0 cellpadding=0>{body}</table>"
+
+
+# Title font, created on first use (QFont needs a QApplication) and shared
+_TITLE_FONT = None
+
+
+def _get_title_font() -> QFont:
+    """Return the shared title font, creating it once."""
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont()
+        _TITLE_FONT.setPointSize(13)
+        _TITLE_FONT.setBold(True)
+    return _TITLE_FONT
+
+
+# Model combo entries: model id (item data) -> short description
+_MODEL_BLURBS = {
+    "tiny": "Fastest",
+    "base": "Recommended",
+    "small": "Better Quality",
+    "medium": "Best Quality",
+}
+
 
 class TranscribeWindow(QMainWindow):
     """Main window for configuring transcription settings - Resolve-inspired design."""
@@ -23,6 +77,196 @@ class TranscribeWindow(QMainWindow):
     # Signal emitted when window is closing (for streaming/cancel semantics)
     window_closing = Signal()
     
+    # DaVinci Resolve color scheme. Widgets only set an object name or a
+    # "role" property; Qt parses this sheet once for the whole window.
+    STYLESHEET = """
+        QMainWindow, QWidget {
+            background-color: #1a1a1a;
+            color: #d0d0d0;
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        }
+        QLabel {
+            color: #d0d0d0;
+            background: transparent;
+        }
+        QWidget#container {
+            background: transparent;
+        }
+        QScrollArea {
+            background-color: #1a1a1a;
+            border: none;
+        }
+        
+        /* Toolbar */
+        QFrame#toolbar {
+            background-color: #0e0e0e;
+            border-bottom: 1px solid #2a2a2a;
+        }
+        QLabel#toolbarTitle {
+            color: #FF6E00;
+        }
+        QLabel#versionBadge {
+            color: #707070;
+            font-size: 10px;
+            padding: 4px 8px;
+        }
+        
+        /* Panels */
+        QFrame[role="panel"] {
+            background-color: #1e1e1e;
+            border-bottom: 1px solid #2a2a2a;
+            padding: 0px;
+        }
+        QLabel[role="header"] {
+            color: #707070;
+            font-size: 10px;
+            font-weight: bold;
+            letter-spacing: 1px;
+        }
+        QLabel[role="rowLabel"] {
+            color: #909090;
+            font-size: 11px;
+        }
+        QLabel#value {
+            color: #d0d0d0;
+            font-size: 11px;
+            font-family: 'Consolas', 'Courier New', monospace;
+        }
+        QLabel#timelineInfo {
+            color: #d0d0d0;
+            font-size: 11px;
+            margin-top: 5px;
+        }
+        QLabel[role="field"] {
+            color: #d0d0d0;
+            font-size: 11px;
+            margin-top: 10px;
+        }
+        QLabel#modelLabel {
+            margin-top: 5px;
+        }
+        QLabel#modelWarning {
+            color: #FF9500;
+            font-size: 10px;
+            padding: 8px;
+            background-color: rgba(255, 149, 0, 0.1);
+            border: 1px solid rgba(255, 149, 0, 0.2);
+            border-radius: 3px;
+            margin-top: 10px;
+        }
+        
+        /* Inputs */
+        QComboBox, QSpinBox {
+            background-color: #0e0e0e;
+            border: 1px solid #3a3a3a;
+            border-radius: 3px;
+            padding: 6px 10px;
+            color: #d0d0d0;
+            font-size: 11px;
+            min-height: 24px;
+        }
+        QComboBox:hover, QComboBox:focus, QSpinBox:hover, QSpinBox:focus {
+            border: 1px solid #FF6E00;
+        }
+        QComboBox::drop-down {
+            border: none;
+            width: 20px;
+        }
+        QComboBox::down-arrow {
+            image: none;
+            border-left: 4px solid transparent;
+            border-right: 4px solid transparent;
+            border-top: 4px solid #909090;
+            margin-right: 5px;
+        }
+        QComboBox QAbstractItemView {
+            background-color: #0e0e0e;
+            border: 1px solid #3a3a3a;
+            selection-background-color: #FF6E00;
+            selection-color: #ffffff;
+            color: #d0d0d0;
+            outline: none;
+        }
+        QRadioButton {
+            color: #d0d0d0;
+            font-size: 11px;
+            spacing: 8px;
+            background: transparent;
+        }
+        QRadioButton::indicator {
+            width: 14px;
+            height: 14px;
+            border-radius: 7px;
+            border: 1px solid #5a5a5a;
+            background: #0e0e0e;
+        }
+        QRadioButton::indicator:hover {
+            border: 1px solid #FF6E00;
+        }
+        QRadioButton::indicator:checked {
+            border: 1px solid #FF6E00;
+            background: #FF6E00;
+        }
+        QCheckBox {
+            color: #d0d0d0;
+            font-size: 11px;
+            spacing: 8px;
+            margin-top: 5px;
+            background: transparent;
+        }
+        QCheckBox::indicator {
+            width: 14px;
+            height: 14px;
+            border-radius: 3px;
+            border: 1px solid #5a5a5a;
+            background: #0e0e0e;
+        }
+        QCheckBox::indicator:hover {
+            border: 1px solid #FF6E00;
+        }
+        QCheckBox::indicator:checked {
+            border: 1px solid #FF6E00;
+            background: #FF6E00;
+        }
+        
+        /* Action bar */
+        QFrame#actionBar {
+            background-color: #0e0e0e;
+            border-top: 1px solid #2a2a2a;
+        }
+        QPushButton#testBtn {
+            background-color: #2a2a2a;
+            color: #d0d0d0;
+            border: 1px solid #3a3a3a;
+            border-radius: 3px;
+            padding: 0 16px;
+            font-size: 12px;
+            font-weight: 500;
+        }
+        QPushButton#testBtn:hover {
+            background-color: #353535;
+            border: 1px solid #4a4a4a;
+        }
+        QPushButton#testBtn:pressed {
+            background-color: #1e1e1e;
+        }
+        QPushButton#transcribeBtn {
+            background-color: #FF6E00;
+            color: #ffffff;
+            border: none;
+            border-radius: 3px;
+            padding: 0 20px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        QPushButton#transcribeBtn:hover {
+            background-color: #FF7E10;
+        }
+        QPushButton#transcribeBtn:pressed {
+            background-color: #E56300;
+        }
+    """
+    
     def __init__(self, timeline_info: dict):
         """
         Initialize the main window.
@@ -32,28 +276,23 @@ class TranscribeWindow(QMainWindow):
         """
         super().__init__()
         self.timeline_info = timeline_info
+        # Public flag: when True, Test/Transcribe don't close the window
         self.keep_open = False
+        self._last_selection_sig = None
+        
+        # Coalesced supervisor events (see update_timeline_context)
+        self._pending_timeline = None
+        self._pending_selection = None
+        self._ctx_scheduled = False
         self.setWindowTitle("AI Transcription - Resolve Helper")
         self.resize(800, 720)
         self.setMinimumSize(750, 650)
         
-        # Apply DaVinci Resolve color scheme
-        self.setStyleSheet("""
-            QMainWindow, QWidget { 
-                background-color: #1a1a1a; 
-                color: #d0d0d0;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            }
-            QLabel { 
-                color: #d0d0d0; 
-            }
-        """)
+        # Apply DaVinci Resolve color scheme (one sheet for the whole window)
+        self.setStyleSheet(self.STYLESHEET)
         
         self.init_ui()
 
-    def set_keep_open(self, keep: bool):
-        self.keep_open = bool(keep)
-    
     def init_ui(self):
         """Initialize the user interface."""
         central = QWidget()
@@ -70,7 +309,6 @@ class TranscribeWindow(QMainWindow):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background-color: #1a1a1a; border: none; }")
         
         content = QWidget()
         content_layout = QVBoxLayout(content)
@@ -85,9 +323,11 @@ class TranscribeWindow(QMainWindow):
         timeline_panel = self.create_timeline_info_section()
         content_layout.addWidget(timeline_panel)
         
-        # Settings section
-        settings_panel = self.create_settings_section()
-        content_layout.addWidget(settings_panel)
+        # Settings section: a placeholder until first show (see _ensure_settings)
+        self._content_layout = content_layout
+        self._settings_slot = QWidget()
+        self._settings_built = False
+        content_layout.addWidget(self._settings_slot)
         
         content_layout.addStretch()
         
@@ -98,42 +338,41 @@ class TranscribeWindow(QMainWindow):
         action_bar = self.create_action_bar()
         layout.addWidget(action_bar)
     
+    def showEvent(self, event):
+        """Build the deferred settings section before the first paint."""
+        self._ensure_settings()
+        super().showEvent(event)
+    
+    def _ensure_settings(self):
+        """Swap the settings placeholder for the real section, once."""
+        if self._settings_built:
+            return
+        self._settings_built = True
+        panel = self.create_settings_section()
+        self._content_layout.replaceWidget(self._settings_slot, panel)
+        self._settings_slot.deleteLater()
+        self._settings_slot = None
+    
     def create_toolbar(self) -> QWidget:
         """Create top toolbar similar to Resolve."""
         toolbar = QFrame()
         toolbar.setFixedHeight(50)
-        toolbar.setStyleSheet("""
-            QFrame {
-                background-color: #0e0e0e;
-                border-bottom: 1px solid #2a2a2a;
-            }
-        """)
+        toolbar.setObjectName("toolbar")
         
         layout = QHBoxLayout(toolbar)
         layout.setContentsMargins(20, 0, 20, 0)
         
         # Title with icon
         title = QLabel("🎬 AI Transcription")
-        title_font = QFont()
-        title_font.setPointSize(13)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #FF6E00; background: transparent; border: none;")
+        title.setFont(_get_title_font())
+        title.setObjectName("toolbarTitle")
         layout.addWidget(title)
         
         layout.addStretch()
         
         # Version badge
         version = QLabel("v0.1.0")
-        version.setStyleSheet("""
-            QLabel {
-                color: #707070;
-                font-size: 10px;
-                background: transparent;
-                border: none;
-                padding: 4px 8px;
-            }
-        """)
+        version.setObjectName("versionBadge")
         layout.addWidget(version)
         
         return toolbar
@@ -141,13 +380,7 @@ class TranscribeWindow(QMainWindow):
     def create_timeline_context(self) -> QWidget:
         """Create live timeline context panel."""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #2a2a2a;
-                padding: 0px;
-            }
-        """)
+        panel.setProperty("role", "panel")
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -155,83 +388,57 @@ class TranscribeWindow(QMainWindow):
         
         # Header
         header = QLabel("LIVE TIMELINE")
-        header.setStyleSheet("""
-            QLabel {
-                color: #707070;
-                font-size: 10px;
-                font-weight: bold;
-                letter-spacing: 1px;
-                background: transparent;
-            }
-        """)
+        header.setProperty("role", "header")
         layout.addWidget(header)
         
-        # Context info grid
-        grid = QWidget()
-        grid_layout = QVBoxLayout(grid)
-        grid_layout.setSpacing(6)
-        grid_layout.setContentsMargins(0, 5, 0, 0)
-        
-        self.ctx_name = self.create_context_row("Timeline:", "—")
-        self.ctx_fps = self.create_context_row("FPS:", "—")
-        self.ctx_tc = self.create_context_row("Timecode:", "—")
-        self.ctx_range = self.create_context_row("In/Out:", "—")
-        self.ctx_sel = self.create_context_row("Selection:", "—")
-        
-        for row in [self.ctx_name, self.ctx_fps, self.ctx_tc, self.ctx_range, self.ctx_sel]:
-            grid_layout.addWidget(row)
-        
-        layout.addWidget(grid)
+        # Context info grid (value labels are updated live)
+        grid, values = self.create_context_grid([
+            ("Timeline:", "—"),
+            ("FPS:", "—"),
+            ("Timecode:", "—"),
+            ("In/Out:", "—"),
+            ("Selection:", "—"),
+        ])
+        self.ctx_name, self.ctx_fps, self.ctx_tc, self.ctx_range, self.ctx_sel = values
+        layout.addLayout(grid)
         
         return panel
     
-    def create_context_row(self, label: str, value: str) -> QWidget:
-        """Create a context info row."""
-        row = QWidget()
-        row.setStyleSheet("background: transparent;")
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(10)
-        
-        label_widget = QLabel(label)
-        label_widget.setFixedWidth(90)
-        label_widget.setStyleSheet("""
-            QLabel {
-                color: #909090;
-                font-size: 11px;
-                background: transparent;
-            }
-        """)
-        
-        value_widget = QLabel(value)
-        value_widget.setObjectName("value")
-        value_widget.setStyleSheet("""
-            QLabel {
-                color: #d0d0d0;
-                font-size: 11px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                background: transparent;
-            }
-        """)
-        
-        row_layout.addWidget(label_widget)
-        row_layout.addWidget(value_widget)
-        row_layout.addStretch()
-        
-        # Store value widget for updates
-        row.value_label = value_widget
-        
-        return row
+    def create_context_grid(self, rows: list) -> tuple:
+        """
+        Create a label/value grid without per-row container widgets.
+        
+        Args:
+            rows: List of (label, value) strings
+        
+        Returns:
+            Tuple of (QGridLayout, list of value QLabels in row order)
+        """
+        grid = QGridLayout()
+        grid.setContentsMargins(0, 5, 0, 0)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(6)
+        grid.setColumnMinimumWidth(0, 90)
+        grid.setColumnStretch(1, 1)
+        
+        values = []
+        for row, (label, value) in enumerate(rows):
+            label_widget = QLabel(label)
+            label_widget.setProperty("role", "rowLabel")
+            
+            value_widget = QLabel(value)
+            value_widget.setObjectName("value")
+            
+            grid.addWidget(label_widget, row, 0)
+            grid.addWidget(value_widget, row, 1, Qt.AlignLeft)
+            values.append(value_widget)
+        
+        return grid, values
     
     def create_timeline_info_section(self) -> QWidget:
         """Create the timeline information section."""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #2a2a2a;
-            }
-        """)
+        panel.setProperty("role", "panel")
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -239,48 +446,25 @@ class TranscribeWindow(QMainWindow):
         
         # Header
         header = QLabel("TIMELINE INFORMATION")
-        header.setStyleSheet("""
-            QLabel {
-                color: #707070;
-                font-size: 10px;
-                font-weight: bold;
-                letter-spacing: 1px;
-                background: transparent;
-            }
-        """)
+        header.setProperty("role", "header")
         layout.addWidget(header)
         
-        # Info grid
-        info_grid = QWidget()
-        info_grid.setStyleSheet("background: transparent;")
-        info_layout = QVBoxLayout(info_grid)
-        info_layout.setSpacing(6)
-        info_layout.setContentsMargins(0, 5, 0, 0)
-        
-        name = self.timeline_info.get('name', 'Unknown')
-        duration = self.timeline_info.get('duration', '00:00:00')
-        fps = self.timeline_info.get('fps', '24.00')
-        
-        name_row = self.create_context_row("Name:", name)
-        dur_row = self.create_context_row("Duration:", duration)
-        fps_row = self.create_context_row("Frame Rate:", fps)
-        
-        for row in [name_row, dur_row, fps_row]:
-            info_layout.addWidget(row)
-        
-        layout.addWidget(info_grid)
+        # Static info: one rich-text label instead of a widget per cell
+        info = QLabel(_timeline_info_html(
+            self.timeline_info.get('name', 'Unknown'),
+            self.timeline_info.get('duration', '00:00:00'),
+            self.timeline_info.get('fps', '24.00'),
+        ))
+        info.setObjectName("timelineInfo")
+        info.setTextFormat(Qt.RichText)
+        layout.addWidget(info)
         
         return panel
     
     def create_settings_section(self) -> QWidget:
         """Create the transcription settings section."""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #2a2a2a;
-            }
-        """)
+        panel.setProperty("role", "panel")
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -288,75 +472,40 @@ class TranscribeWindow(QMainWindow):
         
         # Header
         header = QLabel("TRANSCRIPTION SETTINGS")
-        header.setStyleSheet("""
-            QLabel {
-                color: #707070;
-                font-size: 10px;
-                font-weight: bold;
-                letter-spacing: 1px;
-                background: transparent;
-            }
-        """)
+        header.setProperty("role", "header")
         layout.addWidget(header)
         
         # Model selection
         model_label = QLabel("Whisper Model")
-        model_label.setStyleSheet("color: #d0d0d0; font-size: 11px; margin-top: 5px; background: transparent;")
+        model_label.setProperty("role", "field")
+        model_label.setObjectName("modelLabel")
         
         self.model_combo = QComboBox()
-        self.model_combo.addItems([
-            "tiny - Fastest (~75MB)",
-            "base - Recommended (~150MB)",
-            "small - Better Quality (~500MB)",
-            "medium - Best Quality (~1.5GB)"
-        ])
-        self.model_combo.setCurrentIndex(1)
-        self.model_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #0e0e0e;
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                padding: 6px 10px;
-                color: #d0d0d0;
-                font-size: 11px;
-                min-height: 24px;
-            }
-            QComboBox:hover {
-                border: 1px solid #FF6E00;
-            }
-            QComboBox:focus {
-                border: 1px solid #FF6E00;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #909090;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #0e0e0e;
-                border: 1px solid #3a3a3a;
-                selection-background-color: #FF6E00;
-                selection-color: #ffffff;
-                color: #d0d0d0;
-                outline: none;
-            }
-        """)
+        for name, blurb in _MODEL_BLURBS.items():
+            size = ModelManager.AVAILABLE_MODELS[name]["size"]
+            self.model_combo.addItem(f"{name} - {blurb} ({size})", name)
+        
+        # Star and preselect the model recommended for this machine and
+        # timeline length (the driver probe avoids importing CTranslate2)
+        recommended = ModelManager().get_recommended_model(
+            self.get_timeline_minutes(),
+            has_gpu=check_cuda_available()
+        )
+        idx = self.model_combo.findData(recommended)
+        if idx >= 0:
+            self.model_combo.setItemText(idx, f"{self.model_combo.itemText(idx)} ★")
+            self.model_combo.setItemData(idx, "Recommended for this machine", Qt.ToolTipRole)
+        self.model_combo.setCurrentIndex(idx if idx >= 0 else 1)
         
         layout.addWidget(model_label)
         layout.addWidget(self.model_combo)
         
         # Device selection
         device_label = QLabel("Processing Device")
-        device_label.setStyleSheet("color: #d0d0d0; font-size: 11px; margin-top: 10px; background: transparent;")
+        device_label.setProperty("role", "field")
         
         device_container = QWidget()
-        device_container.setStyleSheet("background: transparent;")
+        device_container.setObjectName("container")
         device_layout = QVBoxLayout(device_container)
         device_layout.setSpacing(8)
         device_layout.setContentsMargins(0, 5, 0, 0)
@@ -365,41 +514,8 @@ class TranscribeWindow(QMainWindow):
         self.device_cpu = QRadioButton("CPU Only")
         self.device_gpu = QRadioButton("GPU (CUDA)")
         
-        radio_style = """
-            QRadioButton {
-                color: #d0d0d0;
-                font-size: 11px;
-                spacing: 8px;
-                background: transparent;
-            }
-            QRadioButton::indicator {
-                width: 14px;
-                height: 14px;
-                border-radius: 7px;
-                border: 1px solid #5a5a5a;
-                background: #0e0e0e;
-            }
-            QRadioButton::indicator:hover {
-                border: 1px solid #FF6E00;
-            }
-            QRadioButton::indicator:checked {
-                border: 1px solid #FF6E00;
-                background: #FF6E00;
-            }
-            QRadioButton::indicator:checked:after {
-                content: '';
-                width: 6px;
-                height: 6px;
-                border-radius: 3px;
-                background: white;
-                position: absolute;
-                top: 4px;
-                left: 4px;
-            }
-        """
         
         for radio in [self.device_auto, self.device_cpu, self.device_gpu]:
-            radio.setStyleSheet(radio_style)
             device_layout.addWidget(radio)
         
         self.device_group = QButtonGroup()
@@ -413,46 +529,89 @@ class TranscribeWindow(QMainWindow):
         
         # Language selection
         lang_label = QLabel("Language")
-        lang_label.setStyleSheet("color: #d0d0d0; font-size: 11px; margin-top: 10px; background: transparent;")
+        lang_label.setProperty("role", "field")
         
         self.lang_combo = QComboBox()
-        self.lang_combo.addItems([
-            "Auto-detect",
-            "English", "Spanish", "French", "German", "Italian",
-            "Portuguese", "Chinese", "Japanese", "Korean", "Russian", "Arabic"
-        ])
-        self.lang_combo.setStyleSheet(self.model_combo.styleSheet())
+        for text, code in _LANG_MAP.items():
+            self.lang_combo.addItem(text, code)
         
         layout.addWidget(lang_label)
         layout.addWidget(self.lang_combo)
         
+        # Compute type (quantization) selection
+        compute_label = QLabel("Compute Type")
+        compute_label.setProperty("role", "field")
+        
+        # Item data is the compute_type passed to ModelManager; "default"
+        # lets it pick per device (int8 on CPU, int8_float16 on CUDA)
+        self.compute_combo = QComboBox()
+        for text, compute_type in (
+            ("Auto (recommended)", "default"),
+            ("int8 (CPU)", "int8"),
+            ("int8_float16 (GPU)", "int8_float16"),
+            ("float16 (GPU)", "float16"),
+            ("float32", "float32"),
+        ):
+            self.compute_combo.addItem(text, compute_type)
+        self.compute_combo.setCurrentIndex(0)
+        
+        layout.addWidget(compute_label)
+        layout.addWidget(self.compute_combo)
+        
+        # Quality (beam size) selection
+        quality_label = QLabel("Quality")
+        quality_label.setProperty("role", "field")
+        
+        self.quality_combo = QComboBox()
+        for text, beam_size in (("Fast (greedy)", 1), ("Balanced", 3), ("Best", 5)):
+            self.quality_combo.addItem(text, beam_size)
+        
+        layout.addWidget(quality_label)
+        layout.addWidget(self.quality_combo)
+        
+        # VAD minimum silence
+        vad_label = QLabel("Minimum Silence (VAD)")
+        vad_label.setProperty("role", "field")
+        
+        self.vad_spin = QSpinBox()
+        self.vad_spin.setRange(100, 5000)
+        self.vad_spin.setSingleStep(100)
+        self.vad_spin.setValue(700)
+        self.vad_spin.setSuffix(" ms")
+        self.vad_spin.setToolTip("Lower values skip more non-speech audio (faster on sparse dialogue)")
+        
+        layout.addWidget(vad_label)
+        layout.addWidget(self.vad_spin)
+        
+        # Word timestamps (opt-in; only the JSONL output uses them)
+        self.word_ts_check = QCheckBox("Include word-level timestamps (JSONL)")
+        layout.addWidget(self.word_ts_check)
+        
         # Warning message
-        warning = QLabel("⚠ First run will download the selected model")
-        warning.setStyleSheet("""
-            QLabel {
-                color: #FF9500;
-                font-size: 10px;
-                padding: 8px;
-                background-color: rgba(255, 149, 0, 0.1);
-                border: 1px solid rgba(255, 149, 0, 0.2);
-                border-radius: 3px;
-                margin-top: 10px;
-            }
-        """)
+        warning = QLabel()
+        warning.setObjectName("modelWarning")
+        self.model_warning = warning
         layout.addWidget(warning)
         
+        self.model_combo.currentIndexChanged.connect(self.update_model_warning)
+        self.update_model_warning()
+        
         return panel
     
+    def update_model_warning(self):
+        """Show the selected model's GPU memory footprint in the warning label."""
+        model_name = self.model_combo.currentData()
+        vram = ModelManager.AVAILABLE_MODELS.get(model_name, {}).get("vram")
+        text = "⚠ First run will download the selected model"
+        if vram:
+            text += f" · GPU memory {vram} (int8_float16)"
+        self.model_warning.setText(text)
+    
     def create_action_bar(self) -> QWidget:
         """Create bottom action bar with buttons."""
         bar = QFrame()
         bar.setFixedHeight(60)
-        bar.setStyleSheet("""
-            QFrame {
-                background-color: #0e0e0e;
-                border-top: 1px solid #2a2a2a;
-            }
-        """)
+        bar.setObjectName("actionBar")
         
         layout = QHBoxLayout(bar)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -464,24 +623,7 @@ class TranscribeWindow(QMainWindow):
         self.test_btn.setFixedHeight(36)
         self.test_btn.setMinimumWidth(120)
         self.test_btn.clicked.connect(self.on_test_place)
-        self.test_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #d0d0d0;
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                padding: 0 16px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #353535;
-                border: 1px solid #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-        """)
+        self.test_btn.setObjectName("testBtn")
         layout.addWidget(self.test_btn)
         
         # Transcribe button (primary, Resolve orange)
@@ -490,27 +632,20 @@ class TranscribeWindow(QMainWindow):
         self.transcribe_btn.setMinimumWidth(160)
         self.transcribe_btn.setDefault(True)
         self.transcribe_btn.clicked.connect(self.on_transcribe)
-        self.transcribe_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF6E00;
-                color: #ffffff;
-                border: none;
-                border-radius: 3px;
-                padding: 0 20px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #FF7E10;
-            }
-            QPushButton:pressed {
-                background-color: #E56300;
-            }
-        """)
+        self.transcribe_btn.setObjectName("transcribeBtn")
         layout.addWidget(self.transcribe_btn)
         
         return bar
     
+    def get_timeline_minutes(self) -> float:
+        """Get the timeline duration in minutes (0 if it can't be parsed)."""
+        parts = str(self.timeline_info.get('duration', '')).split(':')[:3]
+        try:
+            hours, minutes, seconds = (float(p) for p in parts)
+        except ValueError:
+            return 0.0
+        return hours * 60 + minutes + seconds / 60
+    
     def get_device_selection(self) -> str:
         """Get the selected device."""
         if self.device_auto.isChecked():
@@ -522,24 +657,27 @@ class TranscribeWindow(QMainWindow):
     
     def get_language_code(self) -> str:
         """Get the selected language code."""
-        lang_map = {
-            "Auto-detect": None,
-            "English": "en", "Spanish": "es", "French": "fr",
-            "German": "de", "Italian": "it", "Portuguese": "pt",
-            "Chinese": "zh", "Japanese": "ja", "Korean": "ko",
-            "Russian": "ru", "Arabic": "ar"
-        }
-        return lang_map.get(self.lang_combo.currentText(), None)
+        return self.lang_combo.currentData()
+    
+    def get_compute_type(self) -> str:
+        """Get the selected compute type ("default" = choose per device)."""
+        return self.compute_combo.currentData()
+    
+    def get_beam_size(self) -> int:
+        """Get the decoder beam size for the selected quality."""
+        return self.quality_combo.currentData()
     
     def on_transcribe(self):
         """Handle transcribe button click."""
-        model_text = self.model_combo.currentText()
-        model_name = model_text.split(" - ")[0].strip()
-        
+        self._ensure_settings()  # Settings widgets may not exist before first show
         settings = {
-            "model": model_name,
+            "model": self.model_combo.currentData(),
             "device": self.get_device_selection(),
             "language": self.get_language_code(),
+            "compute_type": self.get_compute_type(),
+            "beam_size": self.get_beam_size(),
+            "word_timestamps": self.word_ts_check.isChecked(),
+            "vad_min_silence_ms": self.vad_spin.value(),
             "timeline_name": self.timeline_info.get('name', 'Unknown')
         }
         
@@ -562,7 +700,34 @@ class TranscribeWindow(QMainWindow):
         super().closeEvent(event)
 
     # --- Live context updates from supervisor events ---
+    # Events only fill the pending slots; _apply_pending_ctx renders the
+    # latest of each at most once per frame (~16 ms).
     def update_timeline_context(self, timeline: dict):
+        """Queue a live timeline context update."""
+        self._pending_timeline = timeline
+        self._schedule_ctx_update()
+
+    def update_selection(self, items: list):
+        """Queue a selection info update."""
+        self._pending_selection = items
+        self._schedule_ctx_update()
+
+    def _schedule_ctx_update(self):
+        if not self._ctx_scheduled:
+            self._ctx_scheduled = True
+            QTimer.singleShot(16, self._apply_pending_ctx)
+
+    def _apply_pending_ctx(self):
+        """Render the most recent queued timeline/selection events."""
+        self._ctx_scheduled = False
+        timeline, self._pending_timeline = self._pending_timeline, None
+        items, self._pending_selection = self._pending_selection, None
+        if timeline is not None:
+            self._apply_timeline_context(timeline)
+        if items is not None:
+            self._apply_selection(items)
+
+    def _apply_timeline_context(self, timeline: dict):
         """Update live timeline context."""
         name = timeline.get('name') or '—'
         fps = timeline.get('fps') or '—'
@@ -571,31 +736,38 @@ class TranscribeWindow(QMainWindow):
         out_tc = timeline.get('out_tc')
         range_seconds = timeline.get('range_seconds')
         
-        self.ctx_name.value_label.setText(name)
-        self.ctx_fps.value_label.setText(fps)
-        self.ctx_tc.value_label.setText(tc)
+        _set_if_changed(self.ctx_name, name)
+        _set_if_changed(self.ctx_fps, fps)
+        _set_if_changed(self.ctx_tc, tc)
         
         if in_tc and out_tc:
             dur = f" ({range_seconds:.2f}s)" if isinstance(range_seconds, (int, float)) else ""
-            self.ctx_range.value_label.setText(f"{in_tc} → {out_tc}{dur}")
+            _set_if_changed(self.ctx_range, f"{in_tc} → {out_tc}{dur}")
         else:
-            self.ctx_range.value_label.setText("—")
+            _set_if_changed(self.ctx_range, "—")
 
-    def update_selection(self, items: list):
+    def _apply_selection(self, items: list):
         """Update selection info."""
         if not items:
-            self.ctx_sel.value_label.setText("—")
+            self._last_selection_sig = None
+            _set_if_changed(self.ctx_sel, "—")
             return
-        names = [i.get('name') or i.get('type') or 'Item' for i in items][:2]
-        more = '' if len(items) <= 2 else f" +{len(items)-2}"
-        self.ctx_sel.value_label.setText(f"{', '.join(names)}{more}")
+        n = len(items)
+        names = [i.get('name') or i.get('type') or 'Item' for i in items[:2]]
+        
+        # Selection events can arrive in bursts with the same content
+        sig = (tuple(names), n)
+        if sig == self._last_selection_sig:
+            return
+        self._last_selection_sig = sig
+        
+        more = '' if n <= 2 else f" +{n - 2}"
+        _set_if_changed(self.ctx_sel, f"{', '.join(names)}{more}")
     
     def show_error(self, title: str, message: str):
         """Show an error message box."""
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.critical(self, title, message)
     
     def show_info(self, title: str, message: str):
         """Show an info message box."""
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, title, message)
@@ -9,8 +9,29 @@ from PySide6.QtWidgets import (
     QPushButton, QProgressBar, QTextEdit
 )
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont
-from datetime import datetime, timedelta
+from PySide6.QtGui import QFont, QTextCursor
+import time
+
+
+# Title font, created on first use (QFont needs a QApplication) and shared
+_TITLE_FONT = None
+
+
+def _get_title_font() -> QFont:
+    """Return the shared title font, creating it once."""
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont()
+        _TITLE_FONT.setPointSize(12)
+        _TITLE_FONT.setBold(True)
+    return _TITLE_FONT
+
+
+def _fmt_hms(total_s: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    h, r = divmod(total_s, 3600)
+    m, s = divmod(r, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
 
 
 class ProgressWindow(QDialog):
@@ -28,7 +49,7 @@ class ProgressWindow(QDialog):
         """
         super().__init__()
         self.timeline_name = timeline_name
-        self.start_time = datetime.now()
+        self.start_ts = time.monotonic()
         self.setWindowTitle("Transcribing...")
         self.resize(720, 480)
         self.setMinimumSize(640, 420)
@@ -41,12 +62,43 @@ class ProgressWindow(QDialog):
             Qt.CustomizeWindowHint
         )
         
-        self.init_ui()
+        self._completed = False
+        self._tick_pending = False
+        
+        # Progress updates queued for the next _flush
+        self._pending_msgs = []
+        self._pending_status = ""
+        self._pending_progress = None
+        self._flush_scheduled = False
+        
+        # Last values shown, to skip no-op relabels
+        self._last_eta_seconds = None
+        self._last_elapsed_seconds = 0
+        
+        # Log timestamp, re-rendered only when the wall-clock second changes
+        self._log_ts_second = None
+        self._log_ts = ""
         
-        # Timer for elapsed time update
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_elapsed_time)
-        self.timer.start(1000)  # Update every second
+        self.init_ui()
+    
+    def showEvent(self, event):
+        """Start the elapsed-time tick once the dialog is visible."""
+        super().showEvent(event)
+        self._schedule_tick()
+    
+    def _schedule_tick(self):
+        # Elapsed time is refreshed on every progress update; this slow
+        # single-shot tick only covers quiet stretches while visible.
+        if not self._tick_pending and not self._completed:
+            self._tick_pending = True
+            QTimer.singleShot(2000, self._tick)
+    
+    def _tick(self):
+        self._tick_pending = False
+        if self._completed or not self.isVisible():
+            return
+        self.update_elapsed_time()
+        self._schedule_tick()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -56,10 +108,7 @@ class ProgressWindow(QDialog):
         
         # Title
         title = QLabel(f"⏳ Transcribing: {self.timeline_name}")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_get_title_font())
         layout.addWidget(title)
         
         # Progress bar
@@ -109,6 +158,11 @@ class ProgressWindow(QDialog):
             """
         )
         self.log_text.setMaximumHeight(150)
+        # Bound the log: Qt drops the oldest blocks past this count
+        self.log_text.document().setMaximumBlockCount(500)
+        # Persistent cursor used by _flush to insert at the end of the log
+        self._log_cursor = self.log_text.textCursor()
+        self._log_cursor.movePosition(QTextCursor.End)
         layout.addWidget(self.log_text)
         
         # Stats area
@@ -125,12 +179,17 @@ class ProgressWindow(QDialog):
         button_layout.addStretch()
         
         self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("cancelBtn")
+        self.cancel_btn.setProperty("state", "cancel")
         self.cancel_btn.setFixedSize(100, 32)
         self.cancel_btn.clicked.connect(self.on_cancel)
+        # Both states live in one sheet; mark_complete only flips "state"
         self.cancel_btn.setStyleSheet(
             """
-            QPushButton { background-color: #c62828; color: white; font-weight: bold; border: none; border-radius: 4px; }
-            QPushButton:hover { background-color: #b71c1c; }
+            QPushButton#cancelBtn { background-color: #c62828; color: white; font-weight: bold; border: none; border-radius: 4px; }
+            QPushButton#cancelBtn:hover { background-color: #b71c1c; }
+            QPushButton#cancelBtn[state="complete"] { background-color: #4CAF50; }
+            QPushButton#cancelBtn[state="complete"]:hover { background-color: #45a049; }
             """
         )
         button_layout.addWidget(self.cancel_btn)
@@ -141,35 +200,63 @@ class ProgressWindow(QDialog):
         """
         Update the progress display.
         
+        Updates are queued and applied together on the next event-loop
+        pass, so a burst of callbacks costs one relayout.
+        
         Args:
             message: Status message to display
             progress: Progress value from 0.0 to 1.0, or None
         """
-        # Update status label
-        self.status_label.setText(message)
+        now = int(time.time())
+        if now != self._log_ts_second:
+            self._log_ts_second = now
+            self._log_ts = time.strftime("%H:%M:%S", time.localtime(now))
+        self._pending_msgs.append(f"[{self._log_ts}] {message}")
+        self._pending_status = message
+        if progress is not None:
+            self._pending_progress = progress
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush)
+    
+    def _flush(self):
+        """Apply all queued progress updates at once."""
+        self._flush_scheduled = False
+        if not self._pending_msgs:
+            return
+        
+        # Update status label with the latest message
+        self.status_label.setText(self._pending_status)
         
         # Update progress bar
+        progress = self._pending_progress
+        self._pending_progress = None
         if progress is not None:
             percentage = int(progress * 100)
             self.progress_bar.setValue(percentage)
             
             # Estimate remaining time
             if progress > 0.05:  # Only estimate after 5% progress
-                elapsed = (datetime.now() - self.start_time).total_seconds()
+                elapsed = time.monotonic() - self.start_ts
                 total_estimated = elapsed / progress
                 remaining = total_estimated - elapsed
                 
-                if remaining > 0:
-                    remaining_str = str(timedelta(seconds=int(remaining)))
-                    self.remaining_label.setText(f"Estimated: {remaining_str}")
+                # Only relabel when the whole-second ETA actually changes
+                eta_seconds = int(remaining)
+                if remaining > 0 and eta_seconds != self._last_eta_seconds:
+                    self._last_eta_seconds = eta_seconds
+                    self.remaining_label.setText(f"Estimated: {_fmt_hms(eta_seconds)}")
         
-        # Add to log
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        self.update_elapsed_time()
         
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Add to log as plain text at the end, then scroll there in one step
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        text = "\n".join(self._pending_msgs)
+        cursor.insertText(text if cursor.atStart() else "\n" + text)
+        self._pending_msgs.clear()
+        self.log_text.setTextCursor(cursor)
     
     def update_stats(self, segments: int = 0, words: int = 0, language: str = ""):
         """
@@ -196,9 +283,11 @@ class ProgressWindow(QDialog):
     
     def update_elapsed_time(self):
         """Update the elapsed time display."""
-        elapsed = datetime.now() - self.start_time
-        elapsed_str = str(timedelta(seconds=int(elapsed.total_seconds())))
-        self.elapsed_label.setText(f"Time Elapsed: {elapsed_str}")
+        elapsed_seconds = int(time.monotonic() - self.start_ts)
+        if elapsed_seconds == self._last_elapsed_seconds:
+            return
+        self._last_elapsed_seconds = elapsed_seconds
+        self.elapsed_label.setText(f"Time Elapsed: {_fmt_hms(elapsed_seconds)}")
     
     def on_cancel(self):
         """Handle cancel button click."""
@@ -209,29 +298,24 @@ class ProgressWindow(QDialog):
     
     def mark_complete(self):
         """Mark transcription as complete."""
-        self.timer.stop()
+        self._flush()
+        self._completed = True
+        self.update_elapsed_time()
         self.progress_bar.setValue(100)
         self.status_label.setText("✅ Transcription Complete!")
         self.cancel_btn.setText("Close")
         self.cancel_btn.setEnabled(True)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.cancel_btn.setProperty("state", "complete")
+        style = self.cancel_btn.style()
+        style.unpolish(self.cancel_btn)
+        style.polish(self.cancel_btn)
         self.cancel_btn.clicked.disconnect()
         self.cancel_btn.clicked.connect(self.accept)
     
     def mark_error(self, error_message: str):
         """Mark transcription as failed."""
-        self.timer.stop()
+        self._flush()
+        self._completed = True
         self.status_label.setText(f"❌ Error: {error_message}")
         self.status_label.setStyleSheet("font-weight: bold; font-size: 12px; color: #f44336;")
         self.cancel_btn.setText("Close")
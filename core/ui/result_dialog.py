@@ -5,12 +5,176 @@ Result dialog for showing transcription results
 """
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextEdit
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QTextEdit, QFrame
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtCore import Qt, QEvent, QSize
+from PySide6.QtGui import QFont, QPixmap, QPainter, QStaticText, QTransform
 from pathlib import Path
+from typing import Optional
+from math import ceil
+from contextlib import contextmanager
+
+from .styles import install_global_stylesheet
+
+
+# Troubleshooting list for the error dialog. Bullets are literal because
+# QStaticText doesn't draw <ul> list markers.
+SOLUTIONS_HTML = (
+    "• Ensure FFmpeg is installed and in your PATH<br>"
+    "• Check that you have a stable internet connection (for model download)<br>"
+    "• Try using a smaller model (tiny or base)<br>"
+    "• Ensure the timeline contains valid video content<br>"
+    "• Check available disk space (models require ~150MB-1.5GB)"
+)
+
+# Icon/title fonts, built on first use (QFont wants a QGuiApplication)
+_ICON_FONT = None
+_TITLE_FONT = None
+
+
+def _get_fonts() -> tuple:
+    """Return the shared (icon, title) fonts, creating them once."""
+    global _ICON_FONT, _TITLE_FONT
+    if _ICON_FONT is None:
+        _ICON_FONT = QFont()
+        _ICON_FONT.setPointSize(32)
+        _TITLE_FONT = QFont()
+        _TITLE_FONT.setPointSize(16)
+        _TITLE_FONT.setBold(True)
+    return _ICON_FONT, _TITLE_FONT
+
+
+@contextmanager
+def _batched_updates(widget):
+    """
+    Suspend repaints while a widget's children are built, then lay them
+    out in a single pass.
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if widget.layout() is not None:
+            widget.layout().activate()
+        widget.setUpdatesEnabled(True)
+
+
+class StaticTextLabel(QFrame):
+    """
+    Read-only text block backed by pre-laid-out QStaticText.
+    
+    Stands in for a QLabel whose text is fixed once the dialog is built:
+    the layout is computed when the text, font or width changes rather
+    than on every paint. Padding, background, colour and font still come
+    from the widget's stylesheet.
+    """
+    
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._format = Qt.AutoText
+        self._word_wrap = False
+        self._lines = []
+        self._build()
+    
+    def text(self) -> str:
+        return self._text
+    
+    def setText(self, text: str):
+        self._text = text
+        self._build()
+    
+    def setTextFormat(self, fmt: Qt.TextFormat):
+        self._format = fmt
+        self._build()
+    
+    def setWordWrap(self, on: bool):
+        self._word_wrap = on
+        policy = self.sizePolicy()
+        policy.setHeightForWidth(on)
+        self.setSizePolicy(policy)
+        self._relayout()
+    
+    def _build(self):
+        """Create the static text items (plain text gets one per line)."""
+        # QStaticText doesn't break plain text on '\n', so split it here
+        if self._format == Qt.PlainText:
+            parts = self._text.split("\n")
+        else:
+            parts = [self._text]
+        self._lines = []
+        for part in parts:
+            static = QStaticText(part)
+            static.setTextFormat(self._format)
+            static.setPerformanceHint(QStaticText.AggressiveCaching)
+            self._lines.append(static)
+        self._relayout()
+    
+    def _line_height(self, static: QStaticText) -> int:
+        return max(ceil(static.size().height()), self.fontMetrics().height())
+    
+    def _layout_lines(self, lines: list, text_width: float) -> QSize:
+        """Prepare lines at text_width (-1 = no wrapping); return the block size."""
+        width = height = 0
+        for static in lines:
+            static.setTextWidth(text_width)
+            static.prepare(QTransform(), self.font())
+            width = max(width, ceil(static.size().width()))
+            height += self._line_height(static)
+        return QSize(width, height)
+    
+    def _text_size(self, text_width: float) -> QSize:
+        # Measure on copies so the painted lines keep their current layout
+        return self._layout_lines([QStaticText(s) for s in self._lines], text_width)
+    
+    def _margins(self) -> QSize:
+        """Horizontal/vertical space taken by stylesheet padding and border."""
+        inner = self.contentsRect()
+        return QSize(self.width() - inner.width(), self.height() - inner.height())
+    
+    def _relayout(self):
+        width = self.contentsRect().width() if self._word_wrap else -1
+        self._layout_lines(self._lines, width)
+        self.updateGeometry()
+        self.update()
+    
+    def hasHeightForWidth(self) -> bool:
+        return self._word_wrap
+    
+    def heightForWidth(self, width: int) -> int:
+        margins = self._margins()
+        size = self._text_size(max(1, width - margins.width()))
+        return size.height() + margins.height()
+    
+    def sizeHint(self) -> QSize:
+        return self._text_size(-1) + self._margins()
+    
+    def minimumSizeHint(self) -> QSize:
+        if self._word_wrap:
+            margins = self._margins()
+            return QSize(margins.width(), self.heightForWidth(self.width()))
+        return self.sizeHint()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._relayout()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._word_wrap:
+            self._layout_lines(self._lines, self.contentsRect().width())
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)  # Stylesheet background and border
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.setFont(self.font())
+        pos = self.contentsRect().topLeft()
+        for static in self._lines:
+            painter.drawStaticText(pos, static)
+            pos.setY(pos.y() + self._line_height(static))
 
 
 class ResultDialog(QDialog):
@@ -28,6 +192,9 @@ class ResultDialog(QDialog):
         self.result = result
         self.success = success
         
+        # Styling comes from the app-level sheet (set once; no-op afterwards)
+        install_global_stylesheet(QApplication.instance())
+        
         if success:
             self.setWindowTitle("✅ Transcription Complete")
         else:
@@ -43,52 +210,38 @@ class ResultDialog(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
         
-        if self.success:
-            self.create_success_ui(layout)
-        else:
-            self.create_error_ui(layout)
-        
-        # Close button
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        
-        close_btn = QPushButton("Done")
-        close_btn.setFixedSize(100, 35)
-        close_btn.setDefault(True)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        close_btn.clicked.connect(self.accept)
-        button_layout.addWidget(close_btn)
-        
-        layout.addLayout(button_layout)
+        with _batched_updates(self):
+            if self.success:
+                self.create_success_ui(layout)
+            else:
+                self.create_error_ui(layout)
+            
+            # Close button
+            button_layout = QHBoxLayout()
+            button_layout.addStretch()
+            
+            close_btn = QPushButton("Done")
+            close_btn.setFixedSize(100, 35)
+            close_btn.setDefault(True)
+            close_btn.setObjectName("primaryButton")
+            close_btn.clicked.connect(self.accept)
+            button_layout.addWidget(close_btn)
+            
+            layout.addLayout(button_layout)
     
     def create_success_ui(self, layout: QVBoxLayout):
         """Create UI for successful transcription."""
         # Success icon and title
         title_layout = QHBoxLayout()
         
+        icon_font, title_font = _get_fonts()
         icon_label = QLabel("✅")
-        icon_font = QFont()
-        icon_font.setPointSize(32)
         icon_label.setFont(icon_font)
         title_layout.addWidget(icon_label)
         
         title = QLabel("Transcription Complete!")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet("color: #81c784;")
+        title.setObjectName("successTitle")
         title_layout.addWidget(title)
         
         title_layout.addStretch()
@@ -99,45 +252,36 @@ class ResultDialog(QDialog):
             "Successfully transcribed and imported subtitles into your timeline."
         )
         message.setWordWrap(True)
-        message.setStyleSheet("font-size: 12px; color: #c0c0c0;")
+        message.setObjectName("resultMessage")
         layout.addWidget(message)
         
-        # Output file info
-        srt_path = self.result.get('srt_path', '')
-        if srt_path:
-            file_group = QLabel(f"📝 <b>Output File:</b>")
-            layout.addWidget(file_group)
-            
-            file_path_label = QLabel(srt_path)
-            file_path_label.setWordWrap(True)
-            file_path_label.setStyleSheet(
-                """
-                padding: 10px; background-color: #151515; border: 1px solid #2a2a2a; border-radius: 4px; font-family: monospace; font-size: 10px; color: #e0e0e0;
-                """
-            )
-            layout.addWidget(file_path_label)
+        # Output file info (built even without a path so update_result can show it)
+        self.file_group = QLabel(f"📝 <b>Output File:</b>")
+        layout.addWidget(self.file_group)
+        
+        self.file_path_label = StaticTextLabel()
+        self.file_path_label.setTextFormat(Qt.PlainText)
+        self.file_path_label.setWordWrap(True)
+        self.file_path_label.setObjectName("pathBlock")
+        layout.addWidget(self.file_path_label)
+        self._set_srt_path(self.result.get('srt_path', ''))
         
         # Statistics
         stats_label = QLabel("📊 <b>Statistics:</b>")
         layout.addWidget(stats_label)
         
-        stats_text = self.format_statistics()
-        stats_display = QLabel(stats_text)
-        stats_display.setTextFormat(Qt.RichText)
-        stats_display.setStyleSheet(
-            """
-            padding: 15px; background-color: #102a43; border-radius: 6px; font-size: 11px; color: #d0e4ff;
-            """
-        )
-        layout.addWidget(stats_display)
+        self.stats_display = StaticTextLabel(self.format_statistics())
+        self.stats_display.setTextFormat(Qt.PlainText)
+        self.stats_display.setObjectName("statsBlock")
+        layout.addWidget(self.stats_display)
         
         # Info tip
-        tip = QLabel(
+        tip = StaticTextLabel(
             "ℹ️ <i>The subtitle track has been automatically added to your timeline.</i>"
         )
         tip.setTextFormat(Qt.RichText)
         tip.setWordWrap(True)
-        tip.setStyleSheet("color: #90caf9; margin-top: 10px;")
+        tip.setObjectName("resultTip")
         layout.addWidget(tip)
     
     def create_error_ui(self, layout: QVBoxLayout):
@@ -145,59 +289,34 @@ class ResultDialog(QDialog):
         # Error icon and title
         title_layout = QHBoxLayout()
         
+        icon_font, title_font = _get_fonts()
         icon_label = QLabel("❌")
-        icon_font = QFont()
-        icon_font.setPointSize(32)
         icon_label.setFont(icon_font)
         title_layout.addWidget(icon_label)
         
         title = QLabel("Transcription Failed")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet("color: #ef9a9a;")
+        title.setObjectName("errorTitle")
         title_layout.addWidget(title)
         
         title_layout.addStretch()
         layout.addLayout(title_layout)
         
         # Error message
-        error_msg = self.result.get('error', 'Unknown error occurred')
-        message = QLabel(
-            f"An error occurred during transcription:\n\n<b>{error_msg}</b>"
-        )
-        message.setTextFormat(Qt.RichText)
-        message.setWordWrap(True)
-        message.setStyleSheet(
-            """
-            padding: 15px; background-color: #2a1212; border: 1px solid #5a1a1a; border-radius: 4px; color: #ff9e9e;
-            """
-        )
-        layout.addWidget(message)
+        self.error_message = QLabel(self._error_text())
+        self.error_message.setTextFormat(Qt.RichText)
+        self.error_message.setWordWrap(True)
+        self.error_message.setObjectName("errorBlock")
+        layout.addWidget(self.error_message)
         
         # Common solutions
         solutions_label = QLabel("💡 <b>Common Solutions:</b>")
         layout.addWidget(solutions_label)
         
-        solutions = """
-        <ul style="line-height: 1.6;">
-        <li>Ensure FFmpeg is installed and in your PATH</li>
-        <li>Check that you have a stable internet connection (for model download)</li>
-        <li>Try using a smaller model (tiny or base)</li>
-        <li>Ensure the timeline contains valid video content</li>
-        <li>Check available disk space (models require ~150MB-1.5GB)</li>
-        </ul>
-        """
-        
-        solutions_display = QLabel(solutions)
+        solutions_display = StaticTextLabel(SOLUTIONS_HTML)
         solutions_display.setTextFormat(Qt.RichText)
         solutions_display.setWordWrap(True)
-        solutions_display.setStyleSheet(
-            """
-            padding: 15px; background-color: #2a210f; border-radius: 6px; font-size: 11px; color: #ffdd9b;
-            """
-        )
+        solutions_display.setObjectName("solutionsBlock")
         layout.addWidget(solutions_display)
         
         # Support link
@@ -206,9 +325,32 @@ class ResultDialog(QDialog):
         )
         support.setTextFormat(Qt.RichText)
         support.setOpenExternalLinks(True)
-        support.setStyleSheet("color: #bbbbbb; margin-top: 10px;")
+        support.setObjectName("supportLink")
         layout.addWidget(support)
     
+    def update_result(self, result: dict):
+        """
+        Show a new result of the same kind (success or error) in this dialog.
+        
+        Only the result-dependent text is replaced; the widget tree, layouts
+        and stylesheets built by init_ui are reused.
+        """
+        self.result = result
+        if self.success:
+            self._set_srt_path(result.get('srt_path', ''))
+            self.stats_display.setText(self.format_statistics())
+        else:
+            self.error_message.setText(self._error_text())
+    
+    def _set_srt_path(self, srt_path: str):
+        self.file_path_label.setText(srt_path)
+        self.file_group.setVisible(bool(srt_path))
+        self.file_path_label.setVisible(bool(srt_path))
+    
+    def _error_text(self) -> str:
+        error_msg = self.result.get('error', 'Unknown error occurred')
+        return f"An error occurred during transcription:\n\n<b>{error_msg}</b>"
+    
     def format_statistics(self) -> str:
         """Format statistics for display."""
         duration = self.result.get('duration', 0)
@@ -228,17 +370,29 @@ class ResultDialog(QDialog):
         proc_seconds = int(processing_time % 60)
         proc_time_str = f"{proc_minutes}m {proc_seconds}s"
         
-        stats_html = f"""
-        <table cellpadding="5" style="width: 100%;">
-        <tr><td><b>Duration:</b></td><td>{duration_str}</td></tr>
-        <tr><td><b>Language:</b></td><td>{language.capitalize()}</td></tr>
-        <tr><td><b>Segments:</b></td><td>{segments}</td></tr>
-        <tr><td><b>Words:</b></td><td>{words:,}</td></tr>
-        <tr><td><b>Processing Time:</b></td><td>{proc_time_str}</td></tr>
-        </table>
-        """
-        
-        return stats_html
+        # Plain monospace columns; no HTML table to lay out
+        return "\n".join((
+            f"{'Duration:':<18}{duration_str}",
+            f"{'Language:':<18}{language.capitalize()}",
+            f"{'Segments:':<18}{segments}",
+            f"{'Words:':<18}{words:,}",
+            f"{'Processing Time:':<18}{proc_time_str}",
+        ))
+
+
+# Dialog reused by show_success_dialog/show_error_dialog while its kind matches
+_singleton_dialog: Optional[ResultDialog] = None
+
+
+def _reuse_dialog(result: dict, success: bool) -> ResultDialog:
+    """Return the shared dialog updated with result, building it if needed."""
+    global _singleton_dialog
+    dialog = _singleton_dialog
+    if dialog is not None and dialog.success == success:
+        dialog.update_result(result)
+    else:
+        dialog = _singleton_dialog = ResultDialog(result, success=success)
+    return dialog
 
 
 def show_success_dialog(result: dict):
@@ -251,7 +405,7 @@ def show_success_dialog(result: dict):
     Returns:
         True if user clicked OK
     """
-    dialog = ResultDialog(result, success=True)
+    dialog = _reuse_dialog(result, success=True)
     return dialog.exec() == QDialog.Accepted
 
 
@@ -266,6 +420,6 @@ def show_error_dialog(error: str):
         True if user clicked OK
     """
     result = {"error": error}
-    dialog = ResultDialog(result, success=False)
+    dialog = _reuse_dialog(result, success=False)
     return dialog.exec() == QDialog.Accepted
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Application-level stylesheet shared by the dialogs
+"""
+
+# Rules are scoped by dialog class and objectName so they don't leak into
+# windows that carry their own stylesheet (e.g. TranscribeWindow).
+_GLOBAL_QSS = """
+    ResultDialog QPushButton#primaryButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 4px;
+    }
+    ResultDialog QPushButton#primaryButton:hover {
+        background-color: #45a049;
+    }
+    ResultDialog QLabel#successTitle {
+        color: #81c784;
+    }
+    ResultDialog QLabel#errorTitle {
+        color: #ef9a9a;
+    }
+    ResultDialog QLabel#resultMessage {
+        font-size: 12px;
+        color: #c0c0c0;
+    }
+    ResultDialog #pathBlock {
+        padding: 10px;
+        background-color: #151515;
+        border: 1px solid #2a2a2a;
+        border-radius: 4px;
+        font-family: monospace;
+        font-size: 10px;
+        color: #e0e0e0;
+    }
+    ResultDialog #statsBlock {
+        padding: 15px;
+        background-color: #102a43;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+        color: #d0e4ff;
+    }
+    ResultDialog #resultTip {
+        color: #90caf9;
+        margin-top: 10px;
+    }
+    ResultDialog QLabel#errorBlock {
+        padding: 15px;
+        background-color: #2a1212;
+        border: 1px solid #5a1a1a;
+        border-radius: 4px;
+        color: #ff9e9e;
+    }
+    ResultDialog #solutionsBlock {
+        padding: 15px;
+        background-color: #2a210f;
+        border-radius: 6px;
+        font-size: 11px;
+        color: #ffdd9b;
+    }
+    ResultDialog QLabel#supportLink {
+        color: #bbbbbb;
+        margin-top: 10px;
+    }
+"""
+
+
+def install_global_stylesheet(app):
+    """Apply the shared stylesheet to the QApplication (no-op if already set)."""
+    if app is not None and app.styleSheet() != _GLOBAL_QSS:
+        app.setStyleSheet(_GLOBAL_QSS)
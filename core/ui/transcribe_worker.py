@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Background worker that runs transcription off the GUI thread
+"""
+
+from pathlib import Path
+
+from PySide6.QtCore import QEventLoop, QThread, Signal
+
+
+class TranscribeWorker(QThread):
+    """Runs transcribe_video on a worker thread and reports progress via signals."""
+    
+    # Emitted with (message, progress); progress is None for log-only updates
+    progress = Signal(str, object)
+    # Emitted with the TranscriptionResult on success
+    done = Signal(object)
+    # Emitted with the error message on failure or cancellation
+    failed = Signal(str)
+    
+    def __init__(self, input_path: Path, output_path: Path, **transcribe_kwargs):
+        """
+        Initialize the worker.
+        
+        Args:
+            input_path: Path to input video
+            output_path: Path for output SRT
+            **transcribe_kwargs: Extra keyword arguments for transcribe_video
+        """
+        super().__init__()
+        self.input_path = input_path
+        self.output_path = output_path
+        self.transcribe_kwargs = transcribe_kwargs
+        self.cancelled = False
+        self.result = None
+        self.error = None
+    
+    def cancel(self):
+        """Request cancellation; takes effect at the next progress update."""
+        self.cancelled = True
+    
+    def _on_progress(self, message: str, progress):
+        if self.cancelled:
+            raise InterruptedError("Transcription cancelled by user")
+        self.progress.emit(message, progress)
+    
+    def run(self):
+        """Run the transcription (worker thread)."""
+        from ..transcribe import transcribe_video
+        
+        try:
+            self.result = transcribe_video(
+                self.input_path,
+                self.output_path,
+                progress_callback=self._on_progress,
+                **self.transcribe_kwargs
+            )
+        except Exception as e:
+            self.error = "Transcription cancelled by user" if self.cancelled else str(e)
+            self.failed.emit(self.error)
+            return
+        self.done.emit(self.result)
+    
+    def run_and_wait(self):
+        """Start the worker and spin a local event loop until it finishes."""
+        loop = QEventLoop()
+        self.finished.connect(loop.quit)
+        self.start()
+        loop.exec()
+        self.wait()
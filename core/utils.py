@@ -5,14 +5,23 @@ Utility functions for Resolve AI Helper
 """
 
 import json
-import subprocess
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
-import tempfile
-import shutil
+from typing import Optional, Dict, Any, List
 
+# subprocess, shutil and tempfile are imported inside the functions that use
+# them: every CLI command imports this module, most never need them.
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# The get_*_dir helpers are memoized, so each directory is mkdir'd only once
+@lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
     """Get or create the cache directory for models and logs."""
     if sys.platform == "win32":
@@ -27,6 +36,7 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+@lru_cache(maxsize=1)
 def get_models_dir() -> Path:
     """Get or create the models directory."""
     models_dir = get_cache_dir() / "models"
@@ -34,6 +44,7 @@ def get_models_dir() -> Path:
     return models_dir
 
 
+@lru_cache(maxsize=1)
 def get_logs_dir() -> Path:
     """Get or create the logs directory."""
     logs_dir = get_cache_dir() / "logs"
@@ -41,8 +52,10 @@ def get_logs_dir() -> Path:
     return logs_dir
 
 
+@lru_cache(maxsize=1)
 def get_temp_dir() -> Path:
     """Get or create a temporary directory for video processing."""
+    import tempfile
     temp_base = Path(tempfile.gettempdir()) / "resolve-ai-helper"
     temp_base.mkdir(parents=True, exist_ok=True)
     return temp_base
@@ -64,12 +77,16 @@ def extract_audio(video_path: Path, output_path: Optional[Path] = None,
     Raises:
         RuntimeError: If FFmpeg is not found or extraction fails
     """
+    import subprocess
+    from collections import deque
+
     if output_path is None:
         output_path = video_path.with_suffix(".wav")
     
     cmd = [
         "ffmpeg",
         "-y",  # Overwrite output file
+        "-nostats", "-loglevel", "error",  # Only report real errors
         "-i", str(video_path),
         "-ac", "1",  # Mono
         "-ar", str(sample_rate),
@@ -78,37 +95,131 @@ def extract_audio(video_path: Path, output_path: Optional[Path] = None,
     ]
     
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace"
         )
-        return output_path
+    except FileNotFoundError:
+        raise RuntimeError(
+            "FFmpeg not found. Please install FFmpeg and add it to your PATH.\n"
+            "Download from: https://ffmpeg.org/download.html"
+        )
+    
+    # Keep only the tail of stderr for the error message
+    with proc.stderr:
+        tail = deque((line.rstrip() for line in proc.stderr), maxlen=64)
+    if proc.wait() != 0:
+        raise RuntimeError("FFmpeg failed: " + "\n".join(tail))
+    return output_path
+
+
+def extract_audio_pcm(video_path: Path, sample_rate: int = 16000):
+    """
+    Decode a video's audio track to an in-memory mono float32 array.
+    
+    FFmpeg writes raw 16-bit PCM to stdout, so no temporary WAV file is
+    written or re-decoded.
+    
+    Args:
+        video_path: Path to input video file
+        sample_rate: Target sample rate in Hz (default: 16000 for Whisper)
+    
+    Returns:
+        numpy.ndarray of float32 samples in [-1.0, 1.0)
+    
+    Raises:
+        RuntimeError: If FFmpeg is not found or extraction fails
+    """
+    import subprocess
+    import numpy as np
+
+    cmd = [
+        "ffmpeg",
+        "-nostats", "-loglevel", "error",  # Only report real errors
+        "-i", str(video_path),
+        "-vn",  # No video
+        "-f", "s16le",  # Raw 16-bit little-endian PCM
+        "-ac", "1",  # Mono
+        "-ar", str(sample_rate),
+        "pipe:1"
+    ]
+    
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True)
     except FileNotFoundError:
         raise RuntimeError(
             "FFmpeg not found. Please install FFmpeg and add it to your PATH.\n"
             "Download from: https://ffmpeg.org/download.html"
         )
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"FFmpeg failed: {e.stderr}")
+        raise RuntimeError(
+            f"FFmpeg failed: {e.stderr.decode('utf-8', errors='replace')}"
+        )
+    
+    audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to HH:MM:SS format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+# Zero-padded field strings, indexed instead of formatted per timestamp
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+_PAD3 = tuple(f"{i:03d}" for i in range(1000))
+
+
 def format_srt_timestamp(seconds: float) -> str:
     """Format timestamp for SRT subtitle format."""
-    milliseconds = int((seconds % 1) * 1000)
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    # Work in whole milliseconds so e.g. 1.001 doesn't render as ",000"
+    secs, milliseconds = divmod(int(round(seconds * 1000)), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    hh = _PAD2[hours] if hours < 100 else str(hours)
+    return f"{hh}:{_PAD2[minutes]}:{_PAD2[secs]},{_PAD3[milliseconds]}"
+
+
+def format_srt_timestamps(starts, ends) -> List[str]:
+    """
+    Format many SRT time ranges at once ("HH:MM:SS,mmm --> HH:MM:SS,mmm").
+    
+    Args:
+        starts: Sequence or array of start times in seconds
+        ends: Sequence or array of end times in seconds (same length)
+    
+    Returns:
+        One formatted range per start/end pair
+    """
+    import numpy as np
+
+    ms = np.rint(np.asarray((starts, ends), dtype=np.float64) * 1000).astype(np.int64)
+    hours, rem = np.divmod(ms, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, millis = np.divmod(rem, 1000)
+    
+    (h0, h1), (m0, m1) = hours.tolist(), minutes.tolist()
+    (s0, s1), (ms0, ms1) = secs.tolist(), millis.tolist()
+    return [
+        f"{a:02d}:{b:02d}:{c:02d},{d:03d} --> {e:02d}:{f:02d}:{g:02d},{k:03d}"
+        for a, b, c, d, e, f, g, k in zip(h0, m0, s0, ms0, h1, m1, s1, ms1)
+    ]
+
+
+_VALID_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.mxf', '.m4v', '.webm'})
+
+
+def has_video_extension(path: Path) -> bool:
+    """Check if a path has a supported video extension (no filesystem access)."""
+    suffix = path.suffix
+    # Lowercase suffixes (the common case) match without allocating a copy
+    return suffix in _VALID_VIDEO_EXTS or suffix.lower() in _VALID_VIDEO_EXTS
 
 
 def validate_video_file(path: Path) -> bool:
@@ -116,13 +227,34 @@ def validate_video_file(path: Path) -> bool:
     if not path.exists():
         return False
     
-    valid_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.mxf', '.m4v', '.webm'}
-    return path.suffix.lower() in valid_extensions
+    return has_video_extension(path)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string (orjson when available); Paths become str."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib exception either way
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Envelopes with no payload are fixed; serialize them once
+_BARE_RESPONSES = {
+    True: _dumps({"success": True}),
+    False: _dumps({"success": False}),
+}
 
 
 def json_response(success: bool, data: Dict[str, Any] = None, 
-                  error: str = None) -> str:
+                  error: str = None, message: str = None) -> str:
     """Create a standardized JSON response for IPC."""
+    if not (data or error or message):
+        return _BARE_RESPONSES[bool(success)]
+    
     response = {"success": success}
     
     if data:
@@ -131,13 +263,16 @@ def json_response(success: bool, data: Dict[str, Any] = None,
     if error:
         response["error"] = error
     
-    return json.dumps(response, ensure_ascii=False)
+    if message:
+        response["message"] = message
+    
+    return _dumps(response)
 
 
 def parse_json_response(json_str: str) -> Dict[str, Any]:
     """Parse JSON response from executable."""
     try:
-        return json.loads(json_str)
+        return _loads(json_str)
     except json.JSONDecodeError as e:
         return {
             "success": False,
@@ -147,32 +282,147 @@ def parse_json_response(json_str: str) -> Dict[str, Any]:
 
 def cleanup_temp_files(*paths: Path):
     """Clean up temporary files and directories."""
+    import shutil
+
     for path in paths:
-        if path and path.exists():
-            try:
-                if path.is_file():
-                    path.unlink()
-                elif path.is_dir():
-                    shutil.rmtree(path)
-            except Exception as e:
+        if not path:
+            continue
+        # Try the common case (a file) directly instead of stat-ing first
+        try:
+            path.unlink(missing_ok=True)
+        except IsADirectoryError:
+            shutil.rmtree(path, ignore_errors=True)
+        except OSError as e:
+            # Windows and macOS report unlink() on a directory as a permission error
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
                 print(f"Warning: Failed to cleanup {path}: {e}", file=sys.stderr)
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg_available() -> bool:
-    """Check if FFmpeg is available in PATH."""
+    """
+    Check if FFmpeg is available in PATH.
+    
+    The probe runs once per process; call invalidate_ffmpeg_cache() to
+    re-check (e.g. after the user installs FFmpeg).
+    """
+    import subprocess
+
+    # Don't allocate a console window for the probe on Windows
+    flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
     try:
         subprocess.run(
             ["ffmpeg", "-version"],
-            capture_output=True,
-            check=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            creationflags=flags
         )
         return True
     except (FileNotFoundError, subprocess.CalledProcessError):
         return False
 
 
+def invalidate_ffmpeg_cache():
+    """Forget the cached check_ffmpeg_available() result."""
+    check_ffmpeg_available.cache_clear()
+
+
+def get_available_memory() -> Optional[int]:
+    """
+    Get the physical memory currently available, in bytes.
+    
+    Uses OS APIs directly (GlobalMemoryStatusEx on Windows, /proc/meminfo
+    or sysconf elsewhere) so no psutil dependency is needed.
+    
+    Returns:
+        Available bytes, or None if the platform offers no way to tell
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(status)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+        return None
+    
+    # MemAvailable counts reclaimable page cache, unlike sysconf's free pages
+    try:
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def probe_duration(video_path: Path) -> Optional[float]:
+    """
+    Get a media file's duration in seconds with ffprobe.
+    
+    Returns:
+        Duration in seconds, or None if ffprobe is missing or fails
+    """
+    import subprocess
+
+    flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(video_path)
+            ],
+            capture_output=True,
+            check=True,
+            creationflags=flags
+        )
+        return float(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1)
 def check_cuda_available() -> bool:
-    """Check if CUDA is available for GPU acceleration."""
+    """
+    Check if CUDA is available for GPU acceleration.
+    
+    Probes the NVIDIA driver library directly with cuInit() instead of
+    importing torch, which would pull hundreds of MB into the process just
+    to answer yes/no.
+    """
+    if sys.platform != "darwin":
+        import ctypes
+
+        libname = "nvcuda.dll" if sys.platform == "win32" else "libcuda.so.1"
+        try:
+            return ctypes.CDLL(libname).cuInit(0) == 0
+        except (OSError, AttributeError):
+            return False
+    
+    # No CUDA driver library to probe on macOS; defer to torch if installed
     try:
         import torch
         return torch.cuda.is_available()
@@ -0,0 +1,139 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# PyInstaller spec for the resolve_ai_helper onedir build (run via build_exe.py).
+# Hidden imports and excludes are applied here in a single Analysis pass so
+# PyInstaller can reuse its cached analysis between builds.
+
+import os
+import shutil
+import sys
+
+from PyInstaller.utils.hooks import (
+    collect_data_files,
+    collect_dynamic_libs,
+    collect_submodules,
+    copy_metadata,
+)
+
+# Faster-whisper runtime (no models bundled). Targeted collection instead of
+# collect_all: its submodules, the VAD assets it loads at runtime, and the
+# CTranslate2 shared libraries.
+fw_hiddenimports = collect_submodules(
+    'faster_whisper', filter=lambda name: '.test' not in name
+)
+fw_datas = collect_data_files('faster_whisper') + copy_metadata('faster_whisper')
+fw_binaries = collect_dynamic_libs('ctranslate2')
+
+hiddenimports = [
+    # Ensure Qt core modules are included (no web/qml)
+    'PySide6.QtCore',
+    'PySide6.QtWidgets',
+    'PySide6.QtGui',
+    'faster_whisper',
+    'tqdm',
+] + fw_hiddenimports
+
+# Exclude known heavy/unused packages
+excludes = [
+    'matplotlib',
+    'scipy',
+    'pandas',
+    'notebook',
+    'IPython',
+    'PIL',
+    'torch',
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtWebEngineQuick',
+    # Heavy transitive deps pulled in by faster-whisper/CTranslate2/PySide6
+    'tkinter',
+    'unittest',
+    'pydoc',
+    'pydoc_data',
+    'test',
+    'distutils',
+    'setuptools',
+    'pip',
+    'sympy',
+    'numpy.f2py',
+    'numpy.testing',
+    # Unused Qt modules (excludes match exact names, so no wildcards)
+    'PySide6.Qt3DAnimation',
+    'PySide6.Qt3DCore',
+    'PySide6.Qt3DExtras',
+    'PySide6.Qt3DInput',
+    'PySide6.Qt3DLogic',
+    'PySide6.Qt3DRender',
+    'PySide6.QtCharts',
+    'PySide6.QtDataVisualization',
+    'PySide6.QtMultimedia',
+    'PySide6.QtQuick',
+    'PySide6.QtQuick3D',
+    'PySide6.QtQuickControls2',
+    'PySide6.QtQuickWidgets',
+    'PySide6.QtQml',
+]
+
+# Strip symbols off Windows; UPX-compress when upx is on PATH (build_exe.py
+# passes --upx-dir), skipping DLLs known to break when packed
+strip = sys.platform != 'win32'
+upx = shutil.which('upx') is not None
+upx_exclude = [
+    'vcruntime140.dll',
+    'vcruntime140_1.dll',
+    'python3.dll',
+    f'python3{sys.version_info.minor}.dll',
+    'qwindows.dll',
+]
+
+# Opt-in variant (build_exe.py --noarchive): plain .pyc files instead of a
+# PYZ skip archive lookups at startup, at the cost of thousands of loose
+# files in the folder users copy into Comp
+NOARCHIVE = os.environ.get('RESOLVE_AI_HELPER_NOARCHIVE') == '1'
+
+icon_path = os.path.join(SPECPATH, 'resources', 'icon.ico')
+icon = [icon_path] if os.path.exists(icon_path) else None
+
+a = Analysis(
+    ['core/cli.py'],
+    pathex=[],
+    binaries=fw_binaries,
+    datas=fw_datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[os.path.join(SPECPATH, 'runtime_hooks', 'disable_site.py')],
+    excludes=excludes,
+    noarchive=NOARCHIVE,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,   # onedir: fast-start exe + folder
+    name='resolve_ai_helper',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip,
+    upx=upx,
+    upx_exclude=upx_exclude,
+    console=True,            # Show console window (needed for CLI)
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=icon,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip,
+    upx=upx,
+    upx_exclude=upx_exclude,
+    name='resolve_ai_helper',
+)
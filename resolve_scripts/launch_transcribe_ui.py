@@ -13,6 +13,11 @@ import json
 import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Resolve's bundled Python usually lacks it
+    orjson = None
+
 print("=" * 60)
 print(" Resolve AI Helper - Transcribe Timeline")
 print("=" * 60)
@@ -66,9 +71,15 @@ try:
     exe_path = script_dir / "resolve_ai_helper.exe"
     onedir_exe = script_dir / "resolve_ai_helper" / "resolve_ai_helper.exe"
     
-    if onedir_exe.exists():
-        exe_path = onedir_exe
-    elif not exe_path.exists():
+    # One stat per candidate, in priority order
+    for candidate in (onedir_exe, exe_path):
+        try:
+            os.stat(candidate)
+        except OSError:
+            continue
+        exe_path = candidate
+        break
+    else:
         print(f"[FAIL] Executable not found. Checked:\n  - {onedir_exe}\n  - {exe_path}")
         print()
         print("Please copy either the onedir folder 'resolve_ai_helper' or the exe to:")
@@ -85,9 +96,15 @@ try:
         "fps": str(fps)
     }
     
-    temp_info_file = Path(tempfile.gettempdir()) / "resolve_timeline_info.json"
-    with open(temp_info_file, 'w') as f:
-        json.dump(timeline_info, f)
+    # Same temp folder the helper uses (core.utils.get_temp_dir), so cleanup is in one place
+    temp_dir = Path(tempfile.gettempdir()) / "resolve-ai-helper"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    temp_info_file = temp_dir / "resolve_timeline_info.json"
+    # Encode once and write in a single call
+    if orjson is not None:
+        temp_info_file.write_bytes(orjson.dumps(timeline_info))
+    else:
+        temp_info_file.write_bytes(json.dumps(timeline_info).encode("utf-8"))
     
     print("Launching transcription UI...")
     print("(Timeline export not yet implemented - you'll need to browse for video)")
@@ -95,11 +112,20 @@ try:
     
     # Step 5: Launch exe - it will open with UI
     # Note: Since we don't have a video file yet, the UI will open with file picker
+    # Nothing reads the UI's output, so std streams go to DEVNULL; with the
+    # default close_fds=True no other Resolve handles leak into the child, and
+    # on Windows it is also detached from Resolve's console and process group
+    popen_kwargs = {}
+    if sys.platform == "win32":
+        popen_kwargs = {
+            "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+        }
     process = subprocess.Popen(
         [str(exe_path), "transcribe", "--timeline-name", timeline_name, "--show-ui"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **popen_kwargs
     )
     
     print("UI launched! Check for the Resolve AI Helper window.")
@@ -15,6 +15,13 @@ import sys
 import tempfile
 from pathlib import Path
 
+# The test caption never changes, so it is encoded once
+_TEST_SRT_BYTES = (
+    "1\n"
+    "00:00:00,000 --> 00:00:05,000\n"
+    "Hello from Resolve AI Helper!\n\n"
+).encode("utf-8")
+
 
 def get_resolve_objects():
     """Get Resolve, Project, Timeline objects from the running app."""
@@ -43,12 +50,7 @@ def get_resolve_objects():
 
 def write_test_srt(path: Path):
     """Write a simple SRT file with a single caption lasting 5 seconds."""
-    content = (
-        "1\n"
-        "00:00:00,000 --> 00:00:05,000\n"
-        "Hello from Resolve AI Helper!\n\n"
-    )
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(_TEST_SRT_BYTES)
 
 
 def import_srt_to_timeline(project, timeline, srt_path: Path) -> bool:
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+#
+# PyInstaller runtime hook: keep the frozen app's import path self-contained.
+#
+# The bootloader normally starts Python with site disabled (sys.flags.no_site),
+# which is what we want. If site did run, drop user site-packages from sys.path
+# and make any later site.main() call a no-op, so imports never probe paths
+# outside the bundle on startup.
+
+import sys
+
+_site = sys.modules.get('site')
+if _site is not None:
+    _site.ENABLE_USER_SITE = False
+    _user_site = getattr(_site, 'USER_SITE', None)
+    if _user_site:
+        sys.path[:] = [p for p in sys.path if not p.startswith(_user_site)]
+    _site.main = lambda: None
+del _site
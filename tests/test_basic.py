@@ -17,6 +17,7 @@ from core.utils import (
     get_models_dir,
     format_duration,
     format_srt_timestamp,
+    format_srt_timestamps,
     check_ffmpeg_available
 )
 
@@ -28,6 +29,49 @@ def test_version():
     print(f"[OK] Version: {__version__}")
 
 
+def test_lazy_core_import():
+    """Test that importing core does not load the transcription stack."""
+    import subprocess
+    code = (
+        "import sys, core; core.__version__; import core.model_manager; "
+        "sys.exit('core.transcribe' in sys.modules "
+        "or 'faster_whisper' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(Path(__file__).parent.parent)
+    )
+    assert result.returncode == 0
+    print("[OK] core imports lazily")
+
+
+def test_cli_script_mode():
+    """Test that core/cli.py works run as a script (no parent package)."""
+    import importlib.util
+    import os
+    import subprocess
+    if importlib.util.find_spec("PySide6") is None:
+        print("[SKIP] PySide6 not installed")
+        return
+    # run_path executes cli.py without a package, as `python core/cli.py`
+    # and the PyInstaller entry point do; _get_app must avoid relative imports
+    code = (
+        "import os, runpy, sys; sys.path.insert(0, os.getcwd()); "
+        "cli = runpy.run_path(os.path.join('core', 'cli.py')); "
+        "app = cli['_get_app'](); "
+        "sys.stdout.flush(); os._exit(0 if app.styleSheet() else 1)"
+    )
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(Path(__file__).parent.parent),
+        env=env
+    )
+    assert result.returncode == 0
+    print("[OK] cli.py runs in script mode")
+
+
 def test_cache_directories():
     """Test cache directory creation."""
     cache_dir = get_cache_dir()
@@ -68,7 +112,14 @@ def test_format_functions():
     # Test SRT timestamp formatting
     srt_ts = format_srt_timestamp(90.5)  # 1 minute, 30.5 seconds
     assert srt_ts == "00:01:30,500"
+    # Milliseconds are rounded, not truncated by float error
+    assert format_srt_timestamp(1.001) == "00:00:01,001"
     print(f"[OK] SRT timestamp: {srt_ts}")
+    
+    # Test bulk SRT range formatting matches the scalar formatter
+    ranges = format_srt_timestamps([90.5, 0.0], [3661.25, 1.0])
+    assert ranges == ["00:01:30,500 --> 01:01:01,250", "00:00:00,000 --> 00:00:01,000"]
+    print(f"[OK] SRT ranges: {ranges[0]}")
 
 
 def test_ffmpeg():
@@ -112,6 +163,8 @@ def run_all_tests():
     
     tests = [
         test_version,
+        test_lazy_core_import,
+        test_cli_script_mode,
         test_cache_directories,
         test_model_manager,
         test_format_functions,